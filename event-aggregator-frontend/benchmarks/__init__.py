@@ -0,0 +1,5 @@
+"""
+Benchmarks for the Event Aggregator backend
+Run a module from the project directory, e.g.
+    python -m benchmarks.password_hashing
+"""
@@ -0,0 +1,55 @@
+"""
+Login throughput benchmark for the password hashing pool
+Runs bcrypt verifications from many concurrent "request threads", first
+inline (as /login used to) and then through PasswordHasher with 1..N
+worker processes, and prints verifications per second for each.
+
+    python -m benchmarks.password_hashing --rounds 10 --requests 64
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from password_hasher import PasswordHasher, _check_password, _hash_password
+
+def measure(check, pw_hash, requests, threads):
+    """Verifications per second with `threads` concurrent callers"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(lambda _: check(pw_hash, 'secret'), range(requests)))
+    elapsed = time.perf_counter() - start
+    assert all(results)
+    return requests / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=12, help='bcrypt work factor')
+    parser.add_argument('--requests', type=int, default=64, help='logins per measurement')
+    parser.add_argument('--threads', type=int, default=32, help='concurrent request threads')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    pw_hash = _hash_password('secret', args.rounds)
+
+    print(f'bcrypt rounds={args.rounds}, {args.requests} logins, {args.threads} request threads')
+    baseline = measure(_check_password, pw_hash, args.requests, args.threads)
+    print(f'{"inline":>10}: {baseline:8.1f} logins/s')
+
+    workers = 1
+    while workers <= args.max_workers:
+        hasher = PasswordHasher(workers=workers, max_pending=args.requests, rounds=args.rounds, timeout=600)
+        hasher.start()
+        try:
+            rate = measure(hasher.check, pw_hash, args.requests, args.threads)
+        finally:
+            hasher.shutdown()
+        print(f'{workers:>3} worker{"s" if workers > 1 else " "}: {rate:8.1f} logins/s  ({rate / baseline:.2f}x inline)')
+        workers *= 2
+
+if __name__ == '__main__':
+    main()
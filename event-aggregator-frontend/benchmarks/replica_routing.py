@@ -0,0 +1,113 @@
+"""
+Local check of read/write splitting with two SQLite files
+A scratch primary and a replica file stand in for a replicated pair; the
+replica is refreshed by copying the primary with SQLite's backup API, so
+"replication lag" lasts exactly until replicate() is called. The check
+counts the statements each database receives while a student browses,
+registers for an event and keeps browsing, and exits with status 1 if any
+request is routed to the wrong database. Each user has their own client
+(cookie jar), and a fresh router stands in for a second worker process.
+
+    python -m benchmarks.replica_routing
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STICKY_SECONDS = 1
+
+def replicate(primary_path, replica_path):
+    source = sqlite3.connect(primary_path)
+    target = sqlite3.connect(replica_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+def main():
+    directory = tempfile.mkdtemp(prefix='replica-routing-')
+    primary_path = os.path.join(directory, 'primary.db')
+    replica_path = os.path.join(directory, 'replica.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{primary_path}'
+    os.environ['DATABASE_REPLICA_URLS'] = f'sqlite:///{replica_path}'
+    os.environ['REPLICA_STICKY_SECONDS'] = str(STICKY_SECONDS)
+
+    from sqlalchemy import event
+    import main
+    from main import app, db, User, Event, NotificationCounter, initialize_database, generate_token
+    from read_replicas import ReplicaRouter
+
+    app.logger.disabled = True
+    initialize_database()
+    with app.app_context():
+        student = User(username='replica_student', email='replica_student@college.edu', password='x',
+                       department='Computer Science and Engineering', year='2nd Year')
+        other = User(username='replica_other', email='replica_other@college.edu', password='x',
+                     department='Civil Engineering', year='1st Year')
+        db.session.add_all([student, other])
+        db.session.flush()
+        db.session.add_all([NotificationCounter(user_id=student.id, unread=0), NotificationCounter(user_id=other.id, unread=0)])
+        starts = datetime.utcnow() + timedelta(days=7)
+        concert = Event(title='Replica Concert', description='Read/write splitting check', category='Cultural',
+                        department='All Departments', venue='Main Auditorium', date_time=starts,
+                        end_time=starts + timedelta(hours=3), max_participants=50, current_participants=0,
+                        contact_email='events@college.edu', created_by=student.id)
+        db.session.add(concert)
+        db.session.commit()
+        student_token, other_token = generate_token(student), generate_token(other)
+        event_id = concert.id
+        statements = Counter()
+        for key, engine in db.engines.items():
+            label = 'primary' if key is None else 'replica'
+            event.listen(engine, 'before_cursor_execute',
+                         lambda *args, label=label: statements.update([label]))
+    replicate(primary_path, replica_path)
+
+    clients = {}
+    failures = []
+
+    def check(description, method, url, token=None, expect_db='replica', verify=None):
+        statements.clear()
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        client = clients.setdefault(token, app.test_client())
+        response = client.open(url, method=method, headers=headers)
+        routed = 'primary' if statements['primary'] else 'replica'
+        ok = routed == expect_db and response.status_code < 400 and (verify is None or verify(response.get_json()))
+        print(f'{"✅" if ok else "❌"} {description:<52} {method} {url:<22} '
+              f'primary={statements["primary"]} replica={statements["replica"]}')
+        if not ok:
+            failures.append(description)
+
+    check('anonymous listing reads the replica', 'GET', '/events')
+    check('student profile reads the replica', 'GET', '/profile', student_token)
+    check('registration writes to the primary', 'POST', f'/events/{event_id}/register', student_token, expect_db='primary')
+    check('registered student reads their write (sticky)', 'GET', f'/events/{event_id}', student_token,
+          expect_db='primary', verify=lambda body: body['event']['is_registered'])
+    check('notifications right after registering (sticky)', 'GET', '/notifications', student_token, expect_db='primary')
+    # Another worker process has none of this one's in-memory state
+    main.replica_router = ReplicaRouter(main.replica_router.replicas, app.config['SECRET_KEY'], STICKY_SECONDS)
+    check('another worker keeps the student on the primary', 'GET', '/my-events', student_token, expect_db='primary',
+          verify=lambda body: [e['id'] for e in body['registered_events']] == [event_id])
+    check('other students keep reading the lagging replica', 'GET', f'/events/{event_id}', other_token,
+          verify=lambda body: body['event']['current_participants'] == 0)
+
+    time.sleep(STICKY_SECONDS + 0.1)
+    replicate(primary_path, replica_path)
+    check('after the window the student is back on the replica', 'GET', '/my-events', student_token,
+          verify=lambda body: [e['id'] for e in body['registered_events']] == [event_id])
+    check('replicated registration is visible to everyone', 'GET', f'/events/{event_id}', other_token,
+          verify=lambda body: body['event']['current_participants'] == 1)
+
+    print(f'\n{"❌" if failures else "✅"} {len(failures)} routing failure(s); databases in {directory}')
+    sys.exit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+Scenario runner: drives the Flask app with realistic traffic mixes
+Each scenario is a user journey (a few requests) repeated by concurrent
+"students" through Flask's test client, in process, so results measure
+the app and the database rather than the network. Latencies are recorded
+per endpoint and reported as p50/p95/p99 plus throughput.
+
+    python -m benchmarks.campus --scale small      # once, to fill the database
+    python -m benchmarks.scenarios
+    python -m benchmarks.scenarios browse search --iterations 500 --threads 16
+    python -m benchmarks.scenarios --json results.json
+    python -m benchmarks.scenarios --baseline results.json --tolerance 20
+
+With --baseline the run fails (exit status 1) when any endpoint's p95 is
+more than --tolerance percent slower than in the saved results.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SEARCH_TERMS = ['robotics', 'machine learning', 'hackathon', 'music festival', 'quiz', 'cyber', 'dance', 'summit']
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+class Recorder:
+    """Thread-safe latency samples per endpoint label"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def request(self, client, method, label, url, expect=(200,), **kwargs):
+        start = time.perf_counter()
+        response = client.open(url, method=method, **kwargs)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.samples[label].append(elapsed)
+            if response.status_code not in expect:
+                self.errors[label] += 1
+        return response
+
+class Campus:
+    """Ids and tokens sampled from the generated database"""
+
+    def __init__(self, app, db, models, generate_token, sample_size=500, seed=7):
+        User, Event = models['User'], models['Event']
+        rng = random.Random(seed)
+        with app.app_context():
+            self.event_ids = list(db.session.scalars(db.select(Event.id).where(Event.is_active == True)))
+            user_ids = list(db.session.scalars(db.select(User.id).where(User.is_admin == False)))
+            if not self.event_ids or not user_ids:
+                print('❌ No campus data; run "python -m benchmarks.campus" first')
+                sys.exit(1)
+            users = db.session.scalars(db.select(User).where(User.id.in_(rng.sample(user_ids, min(sample_size, len(user_ids)))))).all()
+            self.tokens = [generate_token(user) for user in users]
+            self.user_ids = user_ids
+            admin = db.session.scalar(db.select(User).where(User.is_admin == True))
+            self.admin_token = generate_token(admin)
+
+    @staticmethod
+    def auth(token):
+        return {'Authorization': f'Bearer {token}'}
+
+# Scenarios: setup(campus, app, db, models) -> state, step(client, rng, campus, state, recorder)
+
+def browse_step(client, rng, campus, state, recorder):
+    recorder.request(client, 'GET', 'GET /events', f'/events?limit=20&page={rng.randint(1, 20)}')
+    recorder.request(client, 'GET', 'GET /events?upcoming', '/events?upcoming=true&limit=20&cursor=')
+    recorder.request(client, 'GET', 'GET /events/featured', '/events/featured')
+    recorder.request(client, 'GET', 'GET /events/<id>', f'/events/{rng.choice(campus.event_ids)}')
+
+def search_step(client, rng, campus, state, recorder):
+    recorder.request(client, 'GET', 'GET /events?search', f'/events?search={rng.choice(SEARCH_TERMS)}&limit=20')
+
+def register_storm_setup(campus, app, db, models):
+    """A fresh event with few seats that every student wants"""
+    Event = models['Event']
+    with app.app_context():
+        event = Event(
+            title='Benchmark Storm Concert', description='Limited seats', category='Cultural',
+            department='All Departments', venue='Main Auditorium',
+            date_time=datetime.utcnow() + timedelta(days=30), end_time=datetime.utcnow() + timedelta(days=30, hours=3),
+            max_participants=100, current_participants=0, contact_email='storm@bench.campus.edu',
+            created_by=campus.user_ids[0]
+        )
+        db.session.add(event)
+        db.session.commit()
+        return {'event_id': event.id, 'tokens': itertools.cycle(campus.tokens), 'lock': threading.Lock()}
+
+def register_storm_step(client, rng, campus, state, recorder):
+    with state['lock']:
+        token = next(state['tokens'])
+    # 400 = already registered or full, both expected in a storm
+    recorder.request(
+        client, 'POST', 'POST /events/<id>/register', f'/events/{state["event_id"]}/register',
+        expect=(200, 201, 400), headers=campus.auth(token)
+    )
+
+def register_storm_teardown(campus, app, db, models, state):
+    Event, EventRegistration = models['Event'], models['EventRegistration']
+    with app.app_context():
+        event = db.session.get(Event, state['event_id'])
+        admitted = EventRegistration.query.filter_by(event_id=event.id).count()
+        print(f'    storm: {admitted} admitted for {event.max_participants} seats '
+              f'(current_participants={event.current_participants})')
+
+def notification_polling_setup(campus, app, db, models):
+    return {'etags': {}, 'lock': threading.Lock()}
+
+def notification_polling_step(client, rng, campus, state, recorder):
+    token = rng.choice(campus.tokens)
+    headers = campus.auth(token)
+    with state['lock']:
+        etag = state['etags'].get(token)
+    if etag:
+        headers['If-None-Match'] = etag
+    response = recorder.request(
+        client, 'GET', 'GET /notifications', '/notifications?unread_only=true',
+        expect=(200, 304), headers=headers
+    )
+    if response.headers.get('ETag'):
+        with state['lock']:
+            state['etags'][token] = response.headers['ETag']
+
+def admin_stats_step(client, rng, campus, state, recorder):
+    headers = campus.auth(campus.admin_token)
+    recorder.request(client, 'GET', 'GET /stats', '/stats', headers=headers)
+    recorder.request(client, 'GET', 'GET /admin/users', '/admin/users?limit=50', headers=headers)
+    recorder.request(client, 'GET', 'GET /profile', '/profile', headers=campus.auth(rng.choice(campus.tokens)))
+
+SCENARIOS = {
+    'browse': (None, browse_step, None),
+    'search': (None, search_step, None),
+    'register-storm': (register_storm_setup, register_storm_step, register_storm_teardown),
+    'notification-polling': (notification_polling_setup, notification_polling_step, None),
+    'admin-stats': (None, admin_stats_step, None),
+}
+
+def run_scenario(name, app, db, models, campus, iterations, threads, seed):
+    print(f'\n{name}')
+    setup, step, teardown = SCENARIOS[name]
+    state = setup(campus, app, db, models) if setup else None
+    recorder = Recorder()
+    local = threading.local()
+
+    def worker(iteration):
+        if not hasattr(local, 'client'):
+            local.client = app.test_client()
+        step(local.client, random.Random(seed * 1000003 + iteration), campus, state, recorder)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(iterations)))
+    elapsed = time.perf_counter() - start
+
+    if teardown:
+        teardown(campus, app, db, models, state)
+
+    results = {}
+    for label, samples in recorder.samples.items():
+        samples.sort()
+        results[label] = {
+            'requests': len(samples),
+            'errors': recorder.errors[label],
+            'throughput': round(len(samples) / elapsed, 1),
+            'p50_ms': round(percentile(samples, 0.50) * 1000, 2),
+            'p95_ms': round(percentile(samples, 0.95) * 1000, 2),
+            'p99_ms': round(percentile(samples, 0.99) * 1000, 2),
+        }
+    return results
+
+def print_results(results):
+    print(f'  {"endpoint":<30} {"reqs":>7} {"errors":>6} {"req/s":>9} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9}')
+    for label, row in sorted(results.items()):
+        print(f'  {label:<30} {row["requests"]:>7} {row["errors"]:>6} {row["throughput"]:>9.1f} '
+              f'{row["p50_ms"]:>9.2f} {row["p95_ms"]:>9.2f} {row["p99_ms"]:>9.2f}')
+
+def regressions(results, baseline, tolerance):
+    """(scenario, endpoint, old p95, new p95) for every p95 beyond tolerance"""
+    found = []
+    for name, endpoints in results.items():
+        for label, row in endpoints.items():
+            old = baseline.get(name, {}).get(label)
+            if old and row['p95_ms'] > old['p95_ms'] * (1 + tolerance / 100):
+                found.append((name, label, old['p95_ms'], row['p95_ms']))
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('scenarios', nargs='*', help=f'any of {", ".join(SCENARIOS)} (default: all)')
+    parser.add_argument('--iterations', type=int, default=200, help='journeys per scenario')
+    parser.add_argument('--threads', type=int, default=8, help='concurrent students')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--baseline', help='compare p95 against results saved with --json')
+    parser.add_argument('--tolerance', type=float, default=20, help='allowed p95 slowdown in percent')
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f'unknown scenario(s): {", ".join(sorted(unknown))}')
+
+    from main import app, db, User, Event, EventRegistration, generate_token
+
+    # Logging every request to app.log would dominate the measurements
+    app.logger.disabled = True
+    models = {'User': User, 'Event': Event, 'EventRegistration': EventRegistration}
+    campus = Campus(app, db, models, generate_token)
+
+    results = {}
+    for name in args.scenarios or list(SCENARIOS):
+        results[name] = run_scenario(name, app, db, models, campus, args.iterations, args.threads, args.seed)
+        print_results(results[name])
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f'\n💾 Results written to {args.json}')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(results, json.load(f), args.tolerance)
+        for name, label, old, new in found:
+            print(f'❌ {name} {label}: p95 {old:.2f} ms -> {new:.2f} ms')
+        print(f'{"❌" if found else "✅"} {len(found)} regression(s) beyond {args.tolerance:g}%')
+        sys.exit(1 if found else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""
+Certificate PDF rendering off the request threads
+Certificates are rendered from their template_data in a process pool and
+written to content-addressed files (named by the SHA-256 of the PDF), so
+re-rendering identical data reuses the same file and a file never changes
+once its URL has been handed out.
+
+The PDF is written directly (one page, built-in Helvetica fonts), so no
+PDF library is needed. The static part of the page (border, headings,
+signature lines) is rendered once per worker process and cached; only
+the participant fields are laid out per certificate.
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+PAGE_WIDTH, PAGE_HEIGHT = 842, 595  # A4 landscape, in points
+
+# Helvetica advance widths (1/1000 em) for ASCII 32..126, for centering
+HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+]
+
+def text_width(text, size):
+    return sum(HELVETICA_WIDTHS[ord(ch) - 32] if 32 <= ord(ch) <= 126 else 556 for ch in text) * size / 1000
+
+def pdf_string(text):
+    """PDF literal string in WinAnsi encoding; unmappable characters become '?'"""
+    raw = text.encode('cp1252', errors='replace')
+    return b'(' + raw.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+def centered(text, font, size, y, center_x=PAGE_WIDTH / 2, max_width=PAGE_WIDTH - 160):
+    # Shrink long names and titles until they fit between the margins
+    while size > 6 and text_width(text, size) > max_width:
+        size -= 1
+    x = center_x - text_width(text, size) / 2
+    return b'BT /%s %d Tf %.2f %.2f Td %s Tj ET\n' % (font.encode(), size, x, y, pdf_string(text))
+
+@lru_cache(maxsize=1)
+def page_template():
+    """Content stream operators shared by every certificate"""
+    return b''.join([
+        b'0.16 0.33 0.62 RG 6 w 30 30 782 535 re S\n',
+        b'1 w 42 42 758 511 re S\n',
+        b'0.16 0.33 0.62 rg\n',
+        centered('CERTIFICATE OF PARTICIPATION', 'F2', 34, 470),
+        b'0.2 0.2 0.2 rg\n',
+        centered('This is to certify that', 'F1', 16, 400),
+        centered('has successfully participated in', 'F1', 16, 300),
+        b'0.4 0.4 0.4 RG 0.8 w 120 120 m 320 120 l S 522 120 m 722 120 l S\n',
+        centered('Date', 'F1', 12, 104, center_x=220),
+        centered('Event Coordinator', 'F1', 12, 104, center_x=622),
+    ])
+
+def render_pdf(template_data):
+    """PDF bytes for one certificate"""
+    content = page_template() + b''.join([
+        b'0 0 0 rg\n',
+        centered(str(template_data.get('participant_name', '')), 'F2', 30, 345),
+        centered(str(template_data.get('event_name', '')), 'F2', 22, 255),
+        # The completion date sits over the left signature line
+        centered(str(template_data.get('completion_date', '')), 'F1', 12, 128, center_x=220, max_width=190),
+        b'0.4 0.4 0.4 rg\n',
+        centered('Certificate ID: %s' % template_data.get('certificate_id', ''), 'F1', 10, 60),
+    ])
+
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents 4 0 R '
+        b'/Resources << /Font << /F1 5 0 R /F2 6 0 R >> >> >>' % (PAGE_WIDTH, PAGE_HEIGHT),
+        b'<< /Length %d >>\nstream\n' % len(content) + content + b'endstream',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>',
+    ]
+    pdf = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    pdf += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+def render_certificate(template_data, directory):
+    """Render into directory under a content-addressed name; returns the file name"""
+    pdf = render_pdf(template_data)
+    filename = hashlib.sha256(pdf).hexdigest() + '.pdf'
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        # Write then rename, so readers never see a half-written file
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(pdf)
+        os.replace(temporary, path)
+    return filename
+
+class CertificateRenderer:
+    def __init__(self, directory, url_prefix, workers=2, on_done=None):
+        self.directory = directory
+        self.url_prefix = url_prefix
+        self.workers = workers
+        # on_done(certificate_id, url, error) runs once per submitted job
+        self.on_done = on_done
+        self._executor = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.rendered = 0
+        self.failed = 0
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def start(self):
+        """Spawn the worker processes up front instead of on the first request"""
+        if self.workers:
+            list(self._pool().map(text_width, ['warmup'] * self.workers, [12] * self.workers))
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        # Join outside the lock: completion callbacks take it too
+        if executor is not None:
+            executor.shutdown()
+
+    def submit(self, certificate_id, template_data):
+        """Queue a certificate for rendering and return immediately"""
+        with self._lock:
+            self.pending += 1
+        # workers=0 renders inline, e.g. for scripts and debugging
+        if not self.workers:
+            try:
+                filename = render_certificate(template_data, self.directory)
+            except Exception as e:
+                self._finished(certificate_id, None, e)
+            else:
+                self._finished(certificate_id, filename, None)
+            return None
+        future = self._pool().submit(render_certificate, template_data, self.directory)
+        future.add_done_callback(lambda future: self._finished(
+            certificate_id,
+            None if future.exception() else future.result(),
+            future.exception()
+        ))
+        return future
+
+    def _finished(self, certificate_id, filename, error):
+        with self._lock:
+            self.pending -= 1
+            if error is None:
+                self.rendered += 1
+            else:
+                self.failed += 1
+        if self.on_done:
+            url = f'{self.url_prefix}/{filename}' if filename else None
+            self.on_done(certificate_id, url, error)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'pending': self.pending,
+                'rendered': self.rendered,
+                'failed': self.failed
+            }
@@ -0,0 +1,71 @@
+"""
+Write-behind buffer for hot shared counters
+Every registration used to add to the global 'registrations' aggregate
+and bump the global 'events' version in its own transaction, so on a
+server database all registrations queued on the same two rows. Deltas
+added here are summed in memory and written by one background thread
+per process, at most once per interval, so those rows see one short
+transaction per process per interval instead of one per registration.
+
+The thread starts on the first add(), which keeps it out of the parent
+of a pre-forking WSGI server. Deltas still in memory when a process dies
+are lost; the /stats recompute repairs the aggregates and version-based
+ETags also carry a minute bucket.
+"""
+
+import threading
+import time
+from collections import Counter
+
+class DeferredCounters:
+    def __init__(self, apply, interval=1.0, on_error=None):
+        # apply(deltas) writes {key: delta} in one transaction, raising on failure
+        self.apply = apply
+        self.interval = interval
+        self.on_error = on_error
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.flushes = 0
+        self.failures = 0
+
+    def add(self, deltas):
+        with self._lock:
+            self._pending.update(deltas)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='deferred-counters', daemon=True)
+                self._thread.start()
+
+    def flush(self):
+        """Write everything buffered so far; deltas are kept for the next try if the write fails"""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        deltas = {key: delta for key, delta in pending.items() if delta}
+        if not deltas:
+            return
+        try:
+            self.apply(deltas)
+        except Exception:
+            with self._lock:
+                self._pending.update(pending)
+                self.failures += 1
+            raise
+        with self._lock:
+            self.flushes += 1
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.flush()
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'pending': sum(1 for delta in self._pending.values() if delta),
+                'flushes': self.flushes,
+                'failures': self.failures
+            }
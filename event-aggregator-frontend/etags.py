@@ -0,0 +1,43 @@
+"""
+Conditional GET support
+ETags are derived from cheap version counters (see DataVersion in main.py)
+rather than by hashing the response body, so a matching If-None-Match is
+answered with 304 Not Modified before the handler queries or serializes
+anything.
+"""
+
+import hashlib
+from functools import wraps
+
+from flask import request, make_response
+
+def make_etag(*parts):
+    """Stable strong ETag value for a tuple of version parts"""
+    return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+def conditional(version_parts, private=False):
+    """Route decorator answering 304 when the client's ETag is current.
+
+    version_parts receives the same arguments as the route and returns a
+    tuple that changes whenever the response body could change.
+    """
+    cache_control = 'private, no-cache' if private else 'no-cache'
+
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            # full_path: the query string selects a different body
+            etag = make_etag(request.full_path, *version_parts(*args, **kwargs))
+
+            if request.if_none_match.contains(etag):
+                response = make_response('', 304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = cache_control
+            return response
+        return decorated
+    return decorator
@@ -0,0 +1,236 @@
+"""
+Streaming bulk event import (CSV or JSONL)
+Rows are read one at a time from the input stream, validated, checked
+against an in-memory (title, date_time) index of existing events and of
+rows already seen in the file, and inserted in chunked executemany
+batches, one transaction per chunk. Memory stays proportional to the
+dedupe index, not to the file.
+
+Command line:
+    python event_import.py calendar.csv
+    python event_import.py calendar.jsonl --organizer admin@college.edu --dry-run
+
+The same pipeline backs POST /admin/events/import in main.py.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+REQUIRED_FIELDS = ['title', 'description', 'category', 'department', 'venue', 'date_time', 'end_time', 'contact_email']
+MAX_LENGTHS = {
+    'title': 200, 'category': 100, 'department': 100, 'venue': 200,
+    'image_url': 500, 'contact_email': 120, 'contact_phone': 20
+}
+TRUE_VALUES = {'1', 'true', 'yes', 'y'}
+FALSE_VALUES = {'', '0', 'false', 'no', 'n'}
+MAX_REPORTED_ERRORS = 100
+
+class RowError(ValueError):
+    """A row failed validation"""
+
+def parse_datetime(value, field):
+    try:
+        parsed = datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+    except ValueError:
+        raise RowError(f'{field} is not an ISO date/time: {value!r}')
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def parse_bool(value, field):
+    if isinstance(value, bool):
+        return value
+    text = str(value if value is not None else '').strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise RowError(f'{field} must be true or false: {value!r}')
+
+def dedupe_key(title, date_time):
+    return ' '.join(title.lower().split()), date_time
+
+def validate_row(raw, created_by, now):
+    """Turn one input record into an event row dict, or raise RowError"""
+    if not isinstance(raw, dict):
+        raise RowError('row is not an object')
+
+    values = {key: value.strip() if isinstance(value, str) else value for key, value in raw.items() if key}
+    for field in REQUIRED_FIELDS:
+        if values.get(field) in (None, ''):
+            raise RowError(f'{field} is required')
+    for field, limit in MAX_LENGTHS.items():
+        if values.get(field) and len(str(values[field])) > limit:
+            raise RowError(f'{field} is longer than {limit} characters')
+
+    date_time = parse_datetime(values['date_time'], 'date_time')
+    end_time = parse_datetime(values['end_time'], 'end_time')
+    if end_time < date_time:
+        raise RowError('end_time is before date_time')
+
+    registration_deadline = None
+    if values.get('registration_deadline'):
+        registration_deadline = parse_datetime(values['registration_deadline'], 'registration_deadline')
+
+    max_participants = values.get('max_participants')
+    if max_participants in (None, ''):
+        max_participants = None
+    else:
+        try:
+            max_participants = int(max_participants)
+        except (TypeError, ValueError):
+            raise RowError(f'max_participants is not a whole number: {max_participants!r}')
+        if max_participants < 0:
+            raise RowError('max_participants cannot be negative')
+
+    return {
+        'title': str(values['title']),
+        'description': str(values['description']),
+        'category': str(values['category']),
+        'department': str(values['department']),
+        'venue': str(values['venue']),
+        'date_time': date_time,
+        'end_time': end_time,
+        'max_participants': max_participants,
+        'current_participants': 0,
+        'image_url': values.get('image_url') or '/static/images/default-event.jpg',
+        'contact_email': str(values['contact_email']),
+        'contact_phone': str(values['contact_phone']) if values.get('contact_phone') else None,
+        'is_active': True,
+        'is_featured': parse_bool(values.get('is_featured'), 'is_featured'),
+        'registration_deadline': registration_deadline,
+        'created_by': created_by,
+        'created_at': now
+    }
+
+def read_records(stream, fmt):
+    """Yield (line_number, record) from a text stream; bad JSON yields the error"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, RowError(f'invalid JSON: {e.msg}')
+    else:
+        raise ValueError(f'Unsupported format: {fmt}')
+
+def detect_format(filename, default='csv'):
+    if filename and filename.lower().endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    if filename and filename.lower().endswith('.csv'):
+        return 'csv'
+    return default
+
+def text_stream(binary):
+    """Wrap a binary upload/file as UTF-8 text (a BOM from Excel is dropped)"""
+    return io.TextIOWrapper(binary, encoding='utf-8-sig', newline='')
+
+def import_events(db, Event, stream, fmt, created_by, chunk_size=1000, dry_run=False, on_chunk=None):
+    """Stream records into the event table and return a report dict.
+
+    on_chunk(rows) runs inside each chunk's transaction, before commit, so
+    callers can keep derived data (stats, versions) in step.
+    """
+    start = time.perf_counter()
+    now = datetime.utcnow()
+
+    # Dedupe index of what is already in the database: two columns only
+    seen = {dedupe_key(title, date_time) for title, date_time in db.session.query(Event.title, Event.date_time)}
+
+    report = {'total_rows': 0, 'inserted': 0, 'duplicates': 0, 'error_count': 0, 'errors': [], 'dry_run': dry_run}
+    chunk = []
+
+    def flush():
+        if chunk and not dry_run:
+            db.session.execute(db.insert(Event), chunk)
+            if on_chunk:
+                on_chunk(chunk)
+            db.session.commit()
+        report['inserted'] += len(chunk)
+        chunk.clear()
+
+    for line_number, record in read_records(stream, fmt):
+        report['total_rows'] += 1
+        try:
+            if isinstance(record, RowError):
+                raise record
+            row = validate_row(record, created_by, now)
+        except RowError as e:
+            report['error_count'] += 1
+            if len(report['errors']) < MAX_REPORTED_ERRORS:
+                report['errors'].append({'line': line_number, 'error': str(e)})
+            continue
+
+        key = dedupe_key(row['title'], row['date_time'])
+        if key in seen:
+            report['duplicates'] += 1
+            continue
+        seen.add(key)
+
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+
+    elapsed = time.perf_counter() - start
+    report['elapsed_seconds'] = round(elapsed, 3)
+    report['rows_per_second'] = round(report['total_rows'] / elapsed, 1) if elapsed else None
+    return report
+
+def event_rows_stats(rows, event_stats):
+    """Sum the /stats contributions of freshly inserted rows"""
+    totals = {}
+    for row in rows:
+        for name, value in event_stats(SimpleNamespace(**row)).items():
+            totals[name] = totals.get(name, 0) + value
+    return totals
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    parser = argparse.ArgumentParser(description='Bulk import events from CSV or JSONL')
+    parser.add_argument('path', help='CSV or JSONL file ("-" reads stdin)')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], help='defaults to the file extension')
+    parser.add_argument('--organizer', default='admin@college.edu', help='email of the user the events belong to')
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--dry-run', action='store_true', help='validate and dedupe without inserting')
+    args = parser.parse_args()
+
+    from main import app, db, Event, User, record_imported_events
+
+    fmt = args.format or detect_format(args.path)
+    with app.app_context():
+        organizer = User.query.filter_by(email=args.organizer).first()
+        if not organizer:
+            print(f"❌ No user with email {args.organizer}. Run main.py first.")
+            sys.exit(1)
+
+        binary = sys.stdin.buffer if args.path == '-' else open(args.path, 'rb')
+        with text_stream(binary) as stream:
+            report = import_events(
+                db, Event, stream, fmt, organizer.id,
+                chunk_size=args.chunk_size, dry_run=args.dry_run,
+                on_chunk=record_imported_events
+            )
+
+    for error in report['errors']:
+        print(f"  line {error['line']}: {error['error']}")
+    if report['error_count'] > len(report['errors']):
+        print(f"  ... and {report['error_count'] - len(report['errors'])} more errors")
+    print(f"{'🔍 Validated' if args.dry_run else '✅ Imported'} {report['inserted']} events "
+          f"({report['duplicates']} duplicates, {report['error_count']} errors) "
+          f"from {report['total_rows']} rows in {report['elapsed_seconds']}s "
+          f"- {report['rows_per_second']} rows/sec")
@@ -1,35 +1,243 @@
-from flask import Flask, request, jsonify, session
+from flask import Flask, Response, g, has_request_context, request, jsonify, session, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from flask_cors import CORS
-from datetime import datetime, timedelta
+from sqlalchemy import event as sqlalchemy_event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import datetime, timedelta, timezone
 import jwt
 import os
+import base64
+import json
 from functools import wraps
 import logging
+import threading
+import time
 from logging.handlers import RotatingFileHandler
+from search_index import apply_search, ensure_search_index
+from migrations import run_migrations
+from event_import import detect_format, event_rows_stats, import_events, text_stream
+from response_cache import ResponseCache
+from principal_cache import Principal, PrincipalCache
+from versioned_cache import VersionedCache
+from deferred_counters import DeferredCounters
+from request_metrics import RequestMetrics
+from query_counter import QueryStats, active_trackers
+from password_hasher import HasherBusy, PasswordHasher
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from notification_stream import NotificationBroker, format_sse
+from etags import conditional
+from certificate_renderer import CertificateRenderer
+from database_config import (
+    apply_sqlite_pragmas, database_url, engine_options, replica_binds, replica_urls, sqlite_pragmas
+)
+from read_replicas import STICKY_COOKIE, ReplicaRouter, RoutingSession, pin_replica, unpin_replica
+from exports import csv_stream, xlsx_stream
+from serializers import (
+    serialize_admin_user, serialize_certificate, serialize_created_event, serialize_event,
+    serialize_event_detail, serialize_featured_event, serialize_notification,
+    serialize_registered_event
+)
 
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-change-in-production'
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///events.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = database_url(os.environ)  # DATABASE_URL, DB_* variables or sqlite:///events.db
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['DATABASE_POOL_SIZE'] = int(os.environ.get('DATABASE_POOL_SIZE', 10))  # connections kept open per process
+app.config['DATABASE_MAX_OVERFLOW'] = int(os.environ.get('DATABASE_MAX_OVERFLOW', 20))  # extra connections opened under bursts
+app.config['DATABASE_POOL_TIMEOUT'] = int(os.environ.get('DATABASE_POOL_TIMEOUT', 30))  # seconds to wait for a free connection
+app.config['DATABASE_POOL_RECYCLE'] = int(os.environ.get('DATABASE_POOL_RECYCLE', 1800))  # seconds before a server connection is replaced
+app.config['SQLITE_JOURNAL_MODE'] = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')  # WAL lets reads run during writes
+app.config['SQLITE_SYNCHRONOUS'] = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')  # NORMAL is durable enough with WAL
+app.config['SQLITE_BUSY_TIMEOUT'] = int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000))  # ms a writer waits for the lock
+app.config['SQLITE_MMAP_SIZE'] = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))  # bytes of the file read through mmap
+app.config['SQLITE_CACHE_SIZE'] = int(os.environ.get('SQLITE_CACHE_SIZE', -64000))  # page cache per connection (negative = KiB)
+app.config['SQLITE_FOREIGN_KEYS'] = os.environ.get('SQLITE_FOREIGN_KEYS', 'true').lower() == 'true'  # enforce foreign keys like server databases
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(
+    app.config['SQLALCHEMY_DATABASE_URI'],
+    pool_size=app.config['DATABASE_POOL_SIZE'],
+    max_overflow=app.config['DATABASE_MAX_OVERFLOW'],
+    pool_timeout=app.config['DATABASE_POOL_TIMEOUT'],
+    pool_recycle=app.config['DATABASE_POOL_RECYCLE']
+)
+app.config['DATABASE_REPLICA_URLS'] = replica_urls(os.environ)  # read-only copies of the primary (DATABASE_REPLICA_URLS, comma-separated)
+app.config['REPLICA_STICKY_SECONDS'] = float(os.environ.get('REPLICA_STICKY_SECONDS', 5))  # reads stay on the primary this long after a user's write
+app.config['SQLALCHEMY_BINDS'] = replica_binds(
+    app.config['DATABASE_REPLICA_URLS'],
+    pool_size=app.config['DATABASE_POOL_SIZE'],
+    max_overflow=app.config['DATABASE_MAX_OVERFLOW'],
+    pool_timeout=app.config['DATABASE_POOL_TIMEOUT'],
+    pool_recycle=app.config['DATABASE_POOL_RECYCLE']
+)
 app.config['UPLOAD_FOLDER'] = 'static/uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['RESPONSE_CACHE_SIZE'] = 512  # cached public listing responses
+app.config['RESPONSE_CACHE_TTL'] = 30  # max seconds a listing may be stale across processes
+app.config['PRINCIPAL_CACHE_SIZE'] = 4096  # cached (user, token) principals
+app.config['PRINCIPAL_CACHE_TTL'] = 300  # seconds before a cached principal is re-read
+app.config['TOKEN_CLAIMS_MAX_AGE'] = 900  # trust role claims in tokens this young (0 disables)
+app.config['PROFILE_STATS_CACHE_SIZE'] = 4096  # users whose profile statistics are cached
+app.config['BCRYPT_LOG_ROUNDS'] = 12  # bcrypt work factor
+app.config['PASSWORD_HASH_WORKERS'] = os.cpu_count() or 1  # hashing processes (0 hashes inline)
+app.config['PASSWORD_HASH_QUEUE'] = 4 * app.config['PASSWORD_HASH_WORKERS']  # pending hashes before 503
+app.config['PASSWORD_HASH_TIMEOUT'] = 10  # seconds
+app.config['NOTIFICATION_STREAM_HEARTBEAT'] = 15  # seconds between SSE keep-alives
+app.config['NOTIFICATION_STREAM_QUEUE'] = 100  # undelivered messages before a slow stream is dropped
+app.config['STATS_REFRESH_INTERVAL'] = 300  # seconds before /stats aggregates are recomputed from scratch
+app.config['COUNTER_FLUSH_INTERVAL'] = 1.0  # seconds between writes of buffered registration counter deltas
+app.config['SLOW_REQUEST_THRESHOLD'] = 1.0  # seconds; slower requests are logged with their DB time
+app.config['N_PLUS_ONE_THRESHOLD'] = 5  # identical statement shapes per request before warning of N+1
+app.config['QUERY_DEBUG_HEADERS'] = None  # X-Query-* response headers; None follows app.debug
+app.config['CERTIFICATE_RENDER_WORKERS'] = 2  # PDF rendering processes (0 renders inline)
+app.config['EXPORT_FETCH_SIZE'] = 1000  # rows fetched per round trip while streaming exports
+app.config['ATTENDANCE_BATCH_SIZE'] = 900  # user ids per attendance UPDATE (SQLite allows 999 parameters)
+app.config['CERTIFICATE_BATCH_SIZE'] = 900  # certificates inserted and notified per statement (SQLite allows 999 parameters)
 
 # Create upload folder if it doesn't exist
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 # Initialize extensions
-db = SQLAlchemy(app)
+db = SQLAlchemy(app, session_options={'class_': RoutingSession})
 bcrypt = Bcrypt(app)
+response_cache = ResponseCache(
+    maxsize=app.config['RESPONSE_CACHE_SIZE'],
+    ttl=app.config['RESPONSE_CACHE_TTL'],
+    settle=app.config['REPLICA_STICKY_SECONDS'] if app.config['DATABASE_REPLICA_URLS'] else 0
+)
+password_hasher = PasswordHasher(
+    workers=app.config['PASSWORD_HASH_WORKERS'],
+    max_pending=app.config['PASSWORD_HASH_QUEUE'],
+    rounds=app.config['BCRYPT_LOG_ROUNDS'],
+    timeout=app.config['PASSWORD_HASH_TIMEOUT']
+)
+notification_broker = NotificationBroker(queue_size=app.config['NOTIFICATION_STREAM_QUEUE'])
+profile_stats_cache = VersionedCache(maxsize=app.config['PROFILE_STATS_CACHE_SIZE'])
+deferred_counters = DeferredCounters(
+    apply=lambda deltas: write_deferred_counters(deltas),
+    interval=app.config['COUNTER_FLUSH_INTERVAL'],
+    on_error=lambda error: app.logger.error(f'Deferred counter flush error: {str(error)}')
+)
+certificate_renderer = CertificateRenderer(
+    directory=os.path.join(app.static_folder, 'certificates'),
+    url_prefix=f'{app.static_url_path}/certificates',
+    workers=app.config['CERTIFICATE_RENDER_WORKERS'],
+    on_done=lambda certificate_id, url, error: certificate_rendered(certificate_id, url, error)
+)
+request_metrics = RequestMetrics()
+principal_cache = PrincipalCache(
+    maxsize=app.config['PRINCIPAL_CACHE_SIZE'],
+    ttl=app.config['PRINCIPAL_CACHE_TTL'],
+    claims_max_age=app.config['TOKEN_CLAIMS_MAX_AGE']
+)
 CORS(app, origins=["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:3001", "http://127.0.0.1:3001"], supports_credentials=True)
 
+# SQLite tuning, run on every new connection to a SQLite engine
+sqlite_connection_pragmas = sqlite_pragmas(
+    journal_mode=app.config['SQLITE_JOURNAL_MODE'],
+    synchronous=app.config['SQLITE_SYNCHRONOUS'],
+    busy_timeout=app.config['SQLITE_BUSY_TIMEOUT'],
+    mmap_size=app.config['SQLITE_MMAP_SIZE'],
+    cache_size=app.config['SQLITE_CACHE_SIZE'],
+    foreign_keys=app.config['SQLITE_FOREIGN_KEYS']
+)
+
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    apply_sqlite_pragmas(dbapi_connection, sqlite_connection_pragmas)
+
+with app.app_context():
+    for engine in db.engines.values():
+        if engine.dialect.name == 'sqlite':
+            sqlalchemy_event.listen(engine, 'connect', configure_sqlite_connection)
+    replica_router = ReplicaRouter(
+        [engine for key, engine in db.engines.items() if key is not None and key.startswith('replica_')],
+        secret_key=app.config['SECRET_KEY'],
+        sticky_seconds=app.config['REPLICA_STICKY_SECONDS']
+    )
+
 # Setup logging
-handler = RotatingFileHandler('app.log', maxBytes=10000, backupCount=3)
+handler = RotatingFileHandler('app.log', maxBytes=10 * 1024 * 1024, backupCount=3)
 handler.setLevel(logging.INFO)
 app.logger.addHandler(handler)
 
+# Request instrumentation: latency, status and DB time per route, exposed at
+# /metrics, plus per-request statement counts and N+1 detection
+# The start time lives on the statement's execution context, which is
+# discarded with it, so statements that raise (e.g. a duplicate
+# registration's IntegrityError) leave nothing behind on the connection
+@sqlalchemy_event.listens_for(Engine, 'before_cursor_execute')
+def start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    context.statement_started = time.perf_counter()
+
+@sqlalchemy_event.listens_for(Engine, 'after_cursor_execute')
+def stop_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    record_statement(statement, time.perf_counter() - context.statement_started, executemany)
+
+# Failed statements ran against the database too: count and time them
+@sqlalchemy_event.listens_for(Engine, 'handle_error')
+def stop_failed_statement_timer(exception_context):
+    context = exception_context.execution_context
+    if context is not None and hasattr(context, 'statement_started'):
+        record_statement(exception_context.statement, time.perf_counter() - context.statement_started,
+                         context.executemany)
+
+def record_statement(statement, elapsed, executemany):
+    if has_request_context() and 'query_stats' in g:
+        g.query_stats.record(statement, elapsed, executemany)
+    for stats in active_trackers():
+        stats.record(statement, elapsed, executemany)
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    g.query_stats = QueryStats()
+    request_metrics.request_started()
+
+@app.after_request
+def record_request_metrics(response):
+    if 'request_started' in g:
+        elapsed = time.perf_counter() - g.request_started
+        stats = g.query_stats
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        request_metrics.observe(request.method, route, response.status_code, elapsed, stats.time)
+        if elapsed >= app.config['SLOW_REQUEST_THRESHOLD']:
+            app.logger.warning(f'Slow request: {request.method} {request.full_path} took {elapsed:.3f}s ({stats.time:.3f}s in DB)')
+        
+        repeated = stats.repeated(app.config['N_PLUS_ONE_THRESHOLD'])
+        if repeated:
+            app.logger.warning(f'Possible N+1 in {request.method} {route}: ' + '; '.join(f'{count}x {shape[:200]}' for count, shape in repeated))
+        
+        debug_headers = app.config['QUERY_DEBUG_HEADERS']
+        if debug_headers or (debug_headers is None and app.debug):
+            response.headers['X-Query-Count'] = str(stats.count)
+            response.headers['X-Query-Time'] = f'{stats.time * 1000:.2f}ms'
+            response.headers['X-N-Plus-One'] = str(len(repeated))
+            if repeated:
+                count, shape = repeated[0]
+                response.headers['X-N-Plus-One-Query'] = f'{count}x {shape[:200]}'.encode('ascii', 'replace').decode('ascii')
+    return response
+
+# Read-your-writes: after a successful write, keep the writer's reads on
+# the primary until the replicas have caught up. The marker is a cookie, so
+# it holds whichever worker serves the next read (and covers sign-ups,
+# which carry no token yet).
+@app.after_request
+def record_user_write(response):
+    if replica_router.enabled and request.method not in ('GET', 'HEAD', 'OPTIONS') and response.status_code < 400:
+        response.set_cookie(
+            STICKY_COOKIE, replica_router.write_marker(),
+            max_age=int(replica_router.sticky_seconds) + 1, httponly=True, samesite='Lax'
+        )
+    return response
+
+@app.teardown_request
+def finish_request_timer(error=None):
+    if g.pop('request_started', None) is not None:
+        request_metrics.request_finished()
+
 # Database Models
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -69,6 +277,13 @@ class Event(db.Model):
     
     registrations = db.relationship('EventRegistration', backref='event', lazy=True)
     notifications = db.relationship('Notification', backref='event', lazy=True)
+    
+    # Existing databases get these through migrations.py
+    __table_args__ = (
+        db.Index('ix_event_active_date', 'is_active', 'date_time'),
+        db.Index('ix_event_featured_date', 'is_featured', 'date_time'),
+        db.Index('ix_event_created_by', 'created_by'),
+    )
 
 class EventRegistration(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -78,7 +293,11 @@ class EventRegistration(db.Model):
     status = db.Column(db.String(20), default='registered')
     attended = db.Column(db.Boolean, default=False)
     
-    __table_args__ = (db.UniqueConstraint('user_id', 'event_id', name='unique_user_event'),)
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'event_id', name='unique_user_event'),
+        db.Index('ix_registration_user_date', 'user_id', 'registration_date'),
+        db.Index('ix_registration_event_attended', 'event_id', 'attended'),
+    )
 
 class Certificate(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -87,10 +306,18 @@ class Certificate(db.Model):
     issue_date = db.Column(db.DateTime, default=datetime.utcnow)
     certificate_url = db.Column(db.String(500), nullable=True)
     template_data = db.Column(db.JSON, nullable=True)
+    status = db.Column(db.String(20), nullable=False, default='pending', server_default='pending')  # pending, ready, failed
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     user = db.relationship('User', backref='certificates')
     event = db.relationship('Event', backref='certificates')
+    
+    __table_args__ = (
+        db.Index('ix_certificate_user', 'user_id'),
+        db.Index('uq_certificate_user_event', 'user_id', 'event_id', unique=True),
+    )
+
+NOTIFICATION_TYPES = ('info', 'success', 'warning', 'error')
 
 class Notification(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -100,36 +327,94 @@ class Notification(db.Model):
     message = db.Column(db.Text, nullable=False)
     is_read = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    notification_type = db.Column(db.String(50), default='info')  # info, success, warning, error
+    notification_type = db.Column(db.String(50), default='info')  # one of NOTIFICATION_TYPES
+    
+    __table_args__ = (db.Index('ix_notification_user_read_created', 'user_id', 'is_read', 'created_at'),)
+
+class NotificationCounter(db.Model):
+    # Denormalized unread notification count per user, kept in step with
+    # Notification writes. A missing row means "not initialized yet": the
+    # first read counts and stores it. reconcile_unread_counts.py repairs drift.
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    unread = db.Column(db.Integer, nullable=False, default=0)
+
+class StatsCounter(db.Model):
+    # Aggregates behind /stats, adjusted incrementally by every write and
+    # recomputed from scratch by the background refresher. Names: 'users',
+    # 'organizers', 'events', 'active_events', 'recent_events',
+    # 'registrations', 'category:<name>', 'refreshed_at' (unix time)
+    name = db.Column(db.String(150), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+
+class DataVersion(db.Model):
+    # Monotonic change counters backing the ETags of read endpoints.
+    # Scopes: 'events', 'registrations:<user_id>', 'notifications:<user_id>'
+    scope = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+# Resolve a raw JWT to the current user's principal.
+# Returns (current_user, None) on success or (None, error_response).
+def authenticate(token):
+    if not token:
+        return None, (jsonify({'message': 'Token is missing!'}), 401)
+    
+    try:
+        data = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
+        
+        # Cached principal, then signed role claims, then the database
+        current_user = principal_cache.get(data['user_id'], token)
+        if current_user is None:
+            current_user = principal_cache.from_claims(data)
+            # Claims-based entries expire with the claims, not after a full TTL
+            claims_issued_at = data['iat'] if current_user is not None else None
+            if current_user is None:
+                user = User.query.get(data['user_id'])
+                if not user:
+                    return None, (jsonify({'message': 'User not found!'}), 401)
+                current_user = Principal.from_user(user)
+            principal_cache.set(token, current_user, claims_issued_at)
+            
+    except jwt.ExpiredSignatureError:
+        return None, (jsonify({'message': 'Token has expired!'}), 401)
+    except jwt.InvalidTokenError:
+        return None, (jsonify({'message': 'Token is invalid!'}), 401)
+    except Exception as e:
+        return None, (jsonify({'message': 'Token verification failed!'}), 401)
+    
+    return current_user, None
+
+# Helper function to read the Bearer token from the Authorization header
+def bearer_token():
+    token = request.headers.get('Authorization')
+    if not token:
+        return None
+    parts = token.split(' ')
+    return parts[1] if len(parts) > 1 else ''  # Remove 'Bearer ' prefix
 
 # Authentication Decorator
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = request.headers.get('Authorization')
-        
-        if not token:
-            return jsonify({'message': 'Token is missing!'}), 401
-        
-        try:
-            token = token.split(' ')[1]  # Remove 'Bearer ' prefix
-            data = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
-            current_user = User.query.get(data['user_id'])
-            
-            if not current_user:
-                return jsonify({'message': 'User not found!'}), 401
-                
-        except jwt.ExpiredSignatureError:
-            return jsonify({'message': 'Token has expired!'}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({'message': 'Token is invalid!'}), 401
-        except Exception as e:
-            return jsonify({'message': 'Token verification failed!'}), 401
+        current_user, error = authenticate(bearer_token())
+        if error:
+            return error
         
         return f(current_user, *args, **kwargs)
     
     return decorated
 
+# Route decorator sending the endpoint's reads to a read replica, unless the
+# caller wrote too recently for the replicas to have caught up. Must sit
+# directly under @app.route so ETag versions are read from the same database.
+def replica_reads(f):
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        replica = replica_router.choose(request.cookies.get(STICKY_COOKIE))
+        if replica is not None:
+            pin_replica(db.session, replica)
+        return f(*args, **kwargs)
+    return decorated
+
 def admin_required(f):
     @wraps(f)
     def decorated(current_user, *args, **kwargs):
@@ -138,14 +423,315 @@ def admin_required(f):
         return f(current_user, *args, **kwargs)
     return decorated
 
-# Helper function to generate JWT token
-def generate_token(user_id):
+# Helper function to generate JWT token.
+# Role claims let token_required skip the user lookup for fresh tokens.
+def generate_token(user):
+    roles = []
+    if user.is_admin:
+        roles.append('admin')
+    if user.is_organizer:
+        roles.append('organizer')
+    now = datetime.utcnow()
     payload = {
-        'user_id': user_id,
-        'exp': datetime.utcnow() + timedelta(days=7)
+        'user_id': user.id,
+        'username': user.username,
+        'roles': roles,
+        'iat': now,
+        'exp': now + timedelta(days=7)
     }
     return jwt.encode(payload, app.config['SECRET_KEY'], algorithm='HS256')
 
+# Helper functions for opaque keyset pagination cursors over (date_time, id)
+def encode_cursor(event):
+    payload = json.dumps([event.date_time.isoformat(), event.id]).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor):
+    payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+    date_time, event_id = json.loads(payload)
+    return datetime.fromisoformat(date_time), int(event_id)
+
+# Same for the admin user listing, which pages by id
+def encode_user_cursor(user):
+    return base64.urlsafe_b64encode(json.dumps([user.id]).encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_user_cursor(cursor):
+    (user_id,) = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    return int(user_id)
+
+# Helper returning the dialect's INSERT construct with ON CONFLICT support,
+# or None when the backend has no upsert we know how to emit
+def upsert_insert(model):
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        return sqlite_insert(model)
+    if dialect == 'postgresql':
+        return postgresql_insert(model)
+    return None
+
+# Helper function to bump version counters inside the current transaction.
+# Call it before committing any write that changes what a scope's readers see.
+def bump_versions(*scopes):
+    scopes = sorted(set(scopes))
+    if not scopes:
+        return
+    
+    statement = upsert_insert(DataVersion)
+    if statement is not None:
+        statement = statement.values([{'scope': scope, 'version': 1} for scope in scopes])
+        statement = statement.on_conflict_do_update(
+            index_elements=['scope'],
+            set_={'version': DataVersion.version + 1}
+        )
+        db.session.execute(statement)
+        return
+    
+    existing = {scope for (scope,) in db.session.query(DataVersion.scope).filter(DataVersion.scope.in_(scopes))}
+    if existing:
+        DataVersion.query.filter(DataVersion.scope.in_(existing)).update(
+            {DataVersion.version: DataVersion.version + 1}, synchronize_session=False
+        )
+    db.session.add_all(DataVersion(scope=scope, version=1) for scope in scopes if scope not in existing)
+
+# Helper function to bump '<prefix>:<user_id>' counters for every user id
+# selected by user_ids (a SELECT with a user_id column), in one statement
+def bump_user_versions(prefix, user_ids):
+    audience = user_ids.subquery()
+    statement = upsert_insert(DataVersion)
+    if statement is None:
+        bump_versions(*(f'{prefix}:{user_id}' for (user_id,) in db.session.execute(db.select(audience.c.user_id))))
+        return
+    
+    scope = db.literal(f'{prefix}:', db.String) + db.cast(audience.c.user_id, db.String)
+    # WHERE keeps SQLite from parsing ON CONFLICT as a join constraint
+    statement = statement.from_select(
+        ['scope', 'version'],
+        db.select(scope, db.literal(1, db.Integer)).where(db.true()).distinct()
+    ).on_conflict_do_update(
+        index_elements=['scope'],
+        set_={'version': DataVersion.version + 1}
+    )
+    db.session.execute(statement)
+
+# Helper function to read several version counters in one query
+def get_versions(*scopes):
+    versions = dict(db.session.query(DataVersion.scope, DataVersion.version).filter(DataVersion.scope.in_(scopes)))
+    return tuple(versions.get(scope, 0) for scope in scopes)
+
+# Helper function for the 'events' version behind the public listings,
+# read once per request for both the ETag and the response cache key
+def events_version():
+    if 'events_version' not in g:
+        g.events_version = get_versions('events')
+    return g.events_version
+
+# Helper function to read the user id from an optional Bearer token
+def token_user_id():
+    token = request.headers.get('Authorization')
+    if not token:
+        return None
+    try:
+        data = jwt.decode(token.split(' ')[1], app.config['SECRET_KEY'], algorithms=['HS256'])
+        return data['user_id']
+    except Exception:
+        return None
+
+# Helper returning a coarse clock for ETags of time-dependent payloads
+# (upcoming filters, can_register), so they revalidate at least once a minute
+def minute_bucket():
+    return int(datetime.utcnow().timestamp() // 60)
+
+# Helper function to convert a possibly timezone-aware datetime to naive UTC
+def naive_utc(value):
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+# Helper returning what one event contributes to the /stats aggregates
+def event_stats(event, now=None):
+    now = now or datetime.utcnow()
+    created_at = naive_utc(event.created_at) or now
+    return {
+        'events': 1,
+        f'category:{event.category}': 1,
+        'active_events': int(event.is_active is not False and naive_utc(event.date_time) >= now),
+        'recent_events': int(created_at >= now - timedelta(days=7))
+    }
+
+# Helper function to subtract one stats contribution from another
+def stats_delta(after, before):
+    delta = dict(after)
+    for name, value in before.items():
+        delta[name] = delta.get(name, 0) - value
+    return delta
+
+# Helper function to apply /stats deltas inside the caller's transaction
+def adjust_stats(deltas):
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    
+    statement = upsert_insert(StatsCounter)
+    if statement is not None:
+        statement = statement.values([{'name': name, 'value': delta} for name, delta in sorted(deltas.items())])
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=['name'],
+            set_={'value': StatsCounter.value + statement.excluded.value}
+        ))
+        return
+    
+    for name, delta in deltas.items():
+        updated = StatsCounter.query.filter_by(name=name).update(
+            {StatsCounter.value: StatsCounter.value + delta}, synchronize_session=False
+        )
+        if not updated:
+            db.session.add(StatsCounter(name=name, value=delta))
+
+# Helper function to rebuild every /stats aggregate from the source tables
+def recompute_stats():
+    now = datetime.utcnow()
+    values = {
+        'users': User.query.count(),
+        'organizers': User.query.filter_by(is_organizer=True).count(),
+        'events': Event.query.count(),
+        'active_events': Event.query.filter_by(is_active=True).filter(Event.date_time >= now).count(),
+        'recent_events': Event.query.filter(Event.created_at >= now - timedelta(days=7)).count(),
+        'registrations': EventRegistration.query.count(),
+        'refreshed_at': int(now.timestamp())
+    }
+    categories = db.session.query(Event.category, db.func.count(Event.id)).group_by(Event.category)
+    values.update((f'category:{category}', count) for category, count in categories)
+    
+    StatsCounter.query.filter(
+        StatsCounter.name.like('category:%'),
+        StatsCounter.name.notin_(values)
+    ).delete(synchronize_session=False)
+    
+    statement = upsert_insert(StatsCounter)
+    if statement is not None:
+        statement = statement.values([{'name': name, 'value': value} for name, value in sorted(values.items())])
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=['name'],
+            set_={'value': statement.excluded.value}
+        ))
+    else:
+        StatsCounter.query.delete()
+        db.session.add_all(StatsCounter(name=name, value=value) for name, value in values.items())
+    db.session.commit()
+    return values
+
+# Helper function to read the /stats aggregates in one query. Snapshots
+# older than STATS_REFRESH_INTERVAL are recomputed on read, so time-based
+# aggregates (active and recent events) move with the clock even where
+# no refresher thread runs (e.g. under a WSGI server)
+def read_stats():
+    values = dict(db.session.query(StatsCounter.name, StatsCounter.value))
+    stale_before = int(datetime.utcnow().timestamp()) - app.config['STATS_REFRESH_INTERVAL']
+    if values.get('refreshed_at', stale_before) <= stale_before:
+        values = recompute_stats()
+    return values
+
+# Background job recomputing /stats ahead of the readers, so an admin
+# rarely waits for a recompute; any drift from scripts is repaired too
+def start_stats_refresher(interval):
+    def refresh():
+        while True:
+            time.sleep(interval)
+            with app.app_context():
+                try:
+                    recompute_stats()
+                except Exception as e:
+                    db.session.rollback()
+                    app.logger.error(f'Stats refresh error: {str(e)}')
+    
+    thread = threading.Thread(target=refresh, name='stats-refresher', daemon=True)
+    thread.start()
+    return thread
+
+# Deferred counter writer: applies the registration deltas buffered by
+# deferred_counters in one transaction. Keys are ('stats', name) for /stats
+# aggregates and ('version', scope) for DataVersion counters.
+def write_deferred_counters(deltas):
+    with app.app_context():
+        try:
+            adjust_stats({name: delta for (kind, name), delta in deltas.items() if kind == 'stats'})
+            bump_versions(*(scope for kind, scope in deltas if kind == 'version'))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+# Bulk import hook: keeps /stats and ETag versions in step with each
+# chunk of inserted events, inside the chunk's transaction
+def record_imported_events(rows):
+    adjust_stats(event_rows_stats(rows, event_stats))
+    bump_versions('events', *{f'created:{row["created_by"]}' for row in rows})
+
+# Helper function for a user's profile statistics: one aggregate query,
+# cached per user until their registrations or created events change
+def get_profile_stats(user_id):
+    versions = get_versions(f'registrations:{user_id}', f'created:{user_id}')
+    stats = profile_stats_cache.get(user_id, versions)
+    if stats is not None:
+        return stats
+    
+    events_created, events_registered, events_attended = db.session.execute(
+        db.select(
+            db.select(db.func.count()).where(Event.created_by == user_id).scalar_subquery(),
+            db.func.count(EventRegistration.id),
+            db.func.coalesce(db.func.sum(db.case((EventRegistration.attended == True, 1), else_=0)), 0)
+        ).where(EventRegistration.user_id == user_id)
+    ).one()
+    stats = {
+        'events_created': events_created,
+        'events_registered': events_registered,
+        'events_attended': events_attended
+    }
+    profile_stats_cache.set(user_id, versions, stats)
+    return stats
+
+# Helper function to move unread counters of initialized users by delta.
+# user_ids is a list or a SELECT of user ids; runs in the caller's transaction.
+def adjust_unread_counts(user_ids, delta):
+    NotificationCounter.query.filter(NotificationCounter.user_id.in_(user_ids)).update(
+        {NotificationCounter.unread: NotificationCounter.unread + delta},
+        synchronize_session=False
+    )
+
+# Helper function to read unread counts, initializing missing counters
+def get_unread_counts(user_ids):
+    user_ids = list(user_ids)
+    counts = dict(db.session.query(
+        NotificationCounter.user_id,
+        NotificationCounter.unread
+    ).filter(NotificationCounter.user_id.in_(user_ids)))
+    
+    missing = [user_id for user_id in user_ids if user_id not in counts]
+    if missing:
+        # The computed counts are stored, so count on the primary
+        unpin_replica(db.session)
+        computed = dict(db.session.query(
+            Notification.user_id,
+            db.func.count(Notification.id)
+        ).filter(
+            Notification.user_id.in_(missing),
+            Notification.is_read == False
+        ).group_by(Notification.user_id))
+        rows = [{'user_id': user_id, 'unread': computed.get(user_id, 0)} for user_id in missing]
+        
+        statement = upsert_insert(NotificationCounter)
+        if statement is not None:
+            db.session.execute(statement.values(rows).on_conflict_do_nothing(index_elements=['user_id']))
+        else:
+            db.session.add_all(NotificationCounter(**row) for row in rows)
+        db.session.commit()
+        counts.update((row['user_id'], row['unread']) for row in rows)
+    
+    return counts
+
+def get_unread_count(user_id):
+    return get_unread_counts([user_id])[user_id]
+
 # Helper function to create notification
 def create_notification(user_id, title, message, event_id=None, notification_type='info'):
     notification = Notification(
@@ -156,7 +742,237 @@ def create_notification(user_id, title, message, event_id=None, notification_typ
         notification_type=notification_type
     )
     db.session.add(notification)
+    adjust_unread_counts([user_id], 1)
+    bump_versions(f'notifications:{user_id}')
+    db.session.flush()
+    notification_id = notification.id
     db.session.commit()
+    push_notifications(notification_id - 1, [user_id])
+
+# Helper function returning the newest notification id. Rows a transaction
+# inserts after reading it get higher ids, so it is the after_id to push
+# that transaction's notifications with.
+def latest_notification_id():
+    return db.session.query(db.func.max(Notification.id)).scalar() or 0
+
+# Helper function to push committed notifications with ids above after_id
+# to open SSE streams. Only subscribed users are queried, so this is free
+# when nobody listens, and only the writer's own id range is read. Pushes
+# run after the write committed, so failures are logged, not raised: a 500
+# would make clients retry a write that already happened, and streams catch
+# up on reconnect (Last-Event-ID).
+def push_notifications(after_id, user_ids=None):
+    try:
+        subscribed = notification_broker.subscribed_users(user_ids)
+        if not subscribed:
+            return
+        
+        notifications = Notification.query.filter(
+            Notification.user_id.in_(subscribed),
+            Notification.id > after_id
+        ).order_by(Notification.id.asc()).all()
+        for notification in notifications:
+            notification_broker.publish(
+                notification.user_id,
+                'notification',
+                serialize_notification(notification),
+                event_id=notification.id
+            )
+        
+        push_unread_counts(subscribed)
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f'Notification push error: {str(e)}')
+
+# Helper function to push current unread counts to open SSE streams
+def push_unread_counts(user_ids):
+    try:
+        subscribed = notification_broker.subscribed_users(user_ids)
+        if not subscribed:
+            return
+        
+        counts = get_unread_counts(subscribed)
+        for user_id in subscribed:
+            notification_broker.publish(user_id, 'unread_count', {'unread_count': counts[user_id]})
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f'Unread count push error: {str(e)}')
+
+# Notification audiences: each returns a SELECT of the recipients' user ids
+def audience_user_ids(audience, value=None):
+    if audience == 'event':
+        return db.select(EventRegistration.user_id.label('user_id')).where(EventRegistration.event_id == value)
+    if audience == 'department':
+        return db.select(User.id.label('user_id')).where(User.department == value)
+    if audience == 'year':
+        return db.select(User.id.label('user_id')).where(User.year == value)
+    if audience == 'all':
+        return db.select(User.id.label('user_id'))
+    raise ValueError(f'Unknown audience: {audience}')
+
+# Helper function to notify a whole audience with one INSERT ... SELECT.
+# Runs inside the caller's transaction; returns the number of notifications.
+def fan_out_notifications(user_ids, title, message, event_id=None, notification_type='info'):
+    audience = user_ids.subquery()
+    rows = db.select(
+        audience.c.user_id,
+        db.literal(event_id, db.Integer),
+        db.literal(title, db.String),
+        db.literal(message, db.Text),
+        db.false(),
+        db.literal(datetime.utcnow(), db.DateTime),
+        db.literal(notification_type, db.String)
+    )
+    created = db.session.execute(
+        db.insert(Notification).from_select(
+            ['user_id', 'event_id', 'title', 'message', 'is_read', 'created_at', 'notification_type'],
+            rows
+        )
+    ).rowcount
+    adjust_unread_counts(user_ids, 1)
+    bump_user_versions('notifications', user_ids)
+    return created
+
+# Helper function to atomically reserve a seat for an event.
+# The capacity check and the increment run as one conditional UPDATE, so
+# concurrent registrations can never push an event past max_participants.
+def reserve_seat(event_id):
+    participants = db.func.coalesce(Event.current_participants, 0)
+    reserved = Event.query.filter(
+        Event.id == event_id,
+        db.or_(
+            Event.max_participants == None,
+            participants < Event.max_participants
+        )
+    ).update({Event.current_participants: participants + 1}, synchronize_session=False)
+    return reserved == 1
+
+# Helper function to atomically release a previously reserved seat
+def release_seat(event_id):
+    Event.query.filter(
+        Event.id == event_id,
+        Event.current_participants > 0
+    ).update({Event.current_participants: Event.current_participants - 1}, synchronize_session=False)
+
+# Helper function to apply an attendance diff with set-based UPDATEs.
+# Returns (changed to attended, changed to absent, registered users matched).
+def apply_attendance(event_id, attended_ids, absent_ids):
+    batch_size = app.config['ATTENDANCE_BATCH_SIZE']
+    counts = {True: 0, False: 0}
+    matched = 0
+    
+    for attended, user_ids in ((True, attended_ids), (False, absent_ids)):
+        for start in range(0, len(user_ids), batch_size):
+            batch = user_ids[start:start + batch_size]
+            in_batch = db.and_(
+                EventRegistration.event_id == event_id,
+                EventRegistration.user_id.in_(batch)
+            )
+            # Only rows whose value actually flips are written
+            changed = db.or_(EventRegistration.attended.is_(None), EventRegistration.attended != attended)
+            result = db.session.execute(
+                db.update(EventRegistration).where(in_batch, changed).values(attended=attended)
+            )
+            counts[attended] += result.rowcount
+            matched += db.session.scalar(db.select(db.func.count()).where(in_batch))
+            if result.rowcount:
+                bump_user_versions('registrations', db.select(EventRegistration.user_id).where(in_batch))
+    
+    return counts[True], counts[False], matched
+
+# Certificate renderer callback: records where the PDF landed (or that it failed)
+def certificate_rendered(certificate_id, url, error):
+    with app.app_context():
+        if error is not None:
+            app.logger.error(f'Certificate {certificate_id} rendering error: {str(error)}')
+            values = {Certificate.status: 'failed'}
+        else:
+            values = {Certificate.status: 'ready', Certificate.certificate_url: url}
+        Certificate.query.filter_by(id=certificate_id).update(values, synchronize_session=False)
+        db.session.commit()
+
+# Helper function for a user's stored username. Principals come from token
+# claims or the principal cache and can trail a rename in other processes,
+# so text that is persisted (notifications, certificates) reads the name
+# from the database; the principal is for authorization only.
+def stored_username(user_id):
+    return db.session.scalar(db.select(User.username).where(User.id == user_id))
+
+# Helper function to build the data a certificate PDF is rendered from
+def certificate_template_data(event, user_id, username, issued_at):
+    return {
+        'participant_name': username,
+        'event_name': event.title,
+        'completion_date': issued_at.strftime('%B %d, %Y'),
+        'certificate_id': f'CERT-{event.id}-{user_id}-{int(issued_at.timestamp())}'
+    }
+
+# Helper function to issue certificates to every attendee of an event that
+# doesn't have one yet. Certificates are inserted first and only the users
+# whose rows were actually inserted are notified, so concurrent runs never
+# notify anyone twice. Runs inside the caller's transaction; returns
+# (id, template_data) of the new certificates.
+def issue_event_certificates(event):
+    recipients = db.session.execute(
+        db.select(User.id, User.username).join(EventRegistration, EventRegistration.user_id == User.id).where(
+            EventRegistration.event_id == event.id,
+            EventRegistration.attended == True,
+            ~db.exists().where(
+                Certificate.user_id == EventRegistration.user_id,
+                Certificate.event_id == EventRegistration.event_id
+            )
+        )
+    ).all()
+    if not recipients:
+        return []
+    
+    issued_at = datetime.utcnow()
+    rows = [{
+        'user_id': user_id,
+        'event_id': event.id,
+        'issue_date': issued_at,
+        'template_data': certificate_template_data(event, user_id, username, issued_at),
+        'status': 'pending',
+        'created_at': issued_at
+    } for user_id, username in recipients]
+    
+    # A concurrent run may have certified some recipients since the read
+    # above: the conflict clause skips them and RETURNING leaves them out
+    statement = upsert_insert(Certificate)
+    if statement is not None:
+        statement = statement.on_conflict_do_nothing(index_elements=['user_id', 'event_id'])
+    else:
+        statement = db.insert(Certificate)
+    statement = statement.returning(Certificate.id, Certificate.template_data)
+    
+    certificates = []
+    batch_size = app.config['CERTIFICATE_BATCH_SIZE']
+    for start in range(0, len(rows), batch_size):
+        created = db.session.execute(statement, rows[start:start + batch_size]).all()
+        if not created:
+            continue
+        fan_out_notifications(
+            db.select(Certificate.user_id.label('user_id')).where(
+                Certificate.id.in_([certificate_id for certificate_id, _ in created])
+            ),
+            'Certificate Issued',
+            f'Your certificate for "{event.title}" has been issued.',
+            event_id=event.id,
+            notification_type='success'
+        )
+        certificates.extend(created)
+    return certificates
+
+# Helper function to queue every certificate whose PDF hasn't been rendered,
+# e.g. jobs lost to a restart
+def render_pending_certificates():
+    with app.app_context():
+        pending = db.session.execute(
+            db.select(Certificate.id, Certificate.template_data).where(Certificate.status == 'pending')
+        ).all()
+    for certificate_id, template_data in pending:
+        certificate_renderer.submit(certificate_id, template_data or {})
+    return len(pending)
 
 # Initialize database and create admin user
 def initialize_database():
@@ -164,6 +980,12 @@ def initialize_database():
         # Create all tables
         db.create_all()
         
+        # Bring existing databases up to the current schema
+        run_migrations(db, verbose=True)
+        
+        # Create the full-text search index for /events?search=
+        ensure_search_index(db)
+        
         # Create admin user if not exists
         admin = User.query.filter_by(email='admin@college.edu').first()
         if not admin:
@@ -183,6 +1005,13 @@ def initialize_database():
         
         print("Database initialized successfully!")
 
+# Helper response when password hashing is saturated (queue full, or a
+# queued job outlived PASSWORD_HASH_TIMEOUT)
+def server_busy():
+    response = jsonify({'message': 'Server is busy, please try again shortly!'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
 # Routes
 
 @app.route('/')
@@ -216,7 +1045,7 @@ def register():
         if User.query.filter_by(username=data['username']).first():
             return jsonify({'message': 'Username already taken!'}), 400
         
-        hashed_password = bcrypt.generate_password_hash(data['password']).decode('utf-8')
+        hashed_password = password_hasher.hash(data['password'])
         
         user = User(
             username=data['username'],
@@ -228,9 +1057,13 @@ def register():
         )
         
         db.session.add(user)
+        db.session.flush()
+        # New users start with an initialized, exact unread counter
+        db.session.add(NotificationCounter(user_id=user.id, unread=0))
+        adjust_stats({'users': 1, 'organizers': int(bool(user.is_organizer))})
         db.session.commit()
         
-        token = generate_token(user.id)
+        token = generate_token(user)
         
         # Create welcome notification
         create_notification(
@@ -255,6 +1088,11 @@ def register():
             }
         }), 201
         
+    except HasherBusy:
+        return server_busy()
+    except FutureTimeoutError:
+        app.logger.warning('Registration password hashing timed out')
+        return server_busy()
     except Exception as e:
         app.logger.error(f'Registration error: {str(e)}')
         return jsonify({'message': 'Internal server error'}), 500
@@ -269,8 +1107,8 @@ def login():
         
         user = User.query.filter_by(email=data['email']).first()
         
-        if user and bcrypt.check_password_hash(user.password, data['password']):
-            token = generate_token(user.id)
+        if user and password_hasher.check(user.password, data['password']):
+            token = generate_token(user)
             
             app.logger.info(f'User logged in: {user.username}')
             
@@ -290,19 +1128,23 @@ def login():
         
         return jsonify({'message': 'Invalid email or password!'}), 401
         
+    except HasherBusy:
+        return server_busy()
+    except FutureTimeoutError:
+        app.logger.warning('Login password check timed out')
+        return server_busy()
     except Exception as e:
         app.logger.error(f'Login error: {str(e)}')
         return jsonify({'message': 'Internal server error'}), 500
 
 # User Profile Routes
 @app.route('/profile', methods=['GET'])
+@replica_reads
 @token_required
 def get_profile(current_user):
     try:
-        # Get user's event statistics
-        events_created = len(current_user.events_created)
-        events_registered = len(current_user.registrations)
-        events_attended = len([reg for reg in current_user.registrations if reg.attended])
+        # The principal only carries identity and roles; load the full row
+        current_user = User.query.get(current_user.id)
         
         profile_data = {
             'id': current_user.id,
@@ -314,11 +1156,7 @@ def get_profile(current_user):
             'is_admin': current_user.is_admin,
             'created_at': current_user.created_at.isoformat(),
             'profile_picture': current_user.profile_picture,
-            'statistics': {
-                'events_created': events_created,
-                'events_registered': events_registered,
-                'events_attended': events_attended
-            }
+            'statistics': get_profile_stats(current_user.id)
         }
         
         return jsonify({'profile': profile_data})
@@ -331,12 +1169,17 @@ def get_profile(current_user):
 @token_required
 def update_profile(current_user):
     try:
+        current_user = User.query.get(current_user.id)
         data = request.get_json()
+        username_changed = False
         
         if 'username' in data and data['username'] != current_user.username:
             if User.query.filter_by(username=data['username']).first():
                 return jsonify({'message': 'Username already taken!'}), 400
             current_user.username = data['username']
+            # Organizer names appear in event listings
+            bump_versions('events')
+            username_changed = True
         
         if 'department' in data:
             current_user.department = data['department']
@@ -345,6 +1188,9 @@ def update_profile(current_user):
             current_user.year = data['year']
         
         db.session.commit()
+        principal_cache.invalidate(current_user.id)
+        if username_changed:
+            response_cache.invalidate('events')
         
         return jsonify({'message': 'Profile updated successfully!'})
         
@@ -354,6 +1200,9 @@ def update_profile(current_user):
 
 # Event Routes
 @app.route('/events', methods=['GET'])
+@replica_reads
+@conditional(lambda: events_version() + (minute_bucket(),))
+@response_cache.cached('events', versions=events_version)
 def get_events():
     try:
         # Get query parameters for filtering
@@ -365,8 +1214,10 @@ def get_events():
         organizer = request.args.get('organizer')
         limit = int(request.args.get('limit', 50))
         page = int(request.args.get('page', 1))
+        # Opt-in keyset pagination: pass cursor= (empty) for the first page
+        cursor = request.args.get('cursor')
         
-        query = Event.query.filter_by(is_active=True)
+        query = Event.query.options(db.joinedload(Event.organizer)).filter_by(is_active=True)
         
         if category and category != 'all':
             query = query.filter_by(category=category)
@@ -375,13 +1226,8 @@ def get_events():
             query = query.filter_by(department=department)
         
         if search:
-            query = query.filter(
-                db.or_(
-                    Event.title.ilike(f'%{search}%'),
-                    Event.description.ilike(f'%{search}%'),
-                    Event.venue.ilike(f'%{search}%')
-                )
-            )
+            # Cursor pages follow (date_time, id) order, so skip relevance ranking
+            query = apply_search(db, query, Event, search, ranked=cursor is None)
         
         if upcoming:
             query = query.filter(Event.date_time >= datetime.utcnow())
@@ -393,40 +1239,44 @@ def get_events():
             query = query.filter(Event.created_by == organizer)
         
         # Pagination
-        total_events = query.count()
-        events = query.order_by(Event.date_time.asc()).offset((page - 1) * limit).limit(limit).all()
-        
-        events_data = []
-        for event in events:
-            events_data.append({
-                'id': event.id,
-                'title': event.title,
-                'description': event.description,
-                'category': event.category,
-                'department': event.department,
-                'venue': event.venue,
-                'date_time': event.date_time.isoformat(),
-                'end_time': event.end_time.isoformat(),
-                'max_participants': event.max_participants,
-                'current_participants': event.current_participants,
-                'image_url': event.image_url,
-                'contact_email': event.contact_email,
-                'contact_phone': event.contact_phone,
-                'organizer': event.organizer.username,
-                'created_by': event.created_by,
-                'is_featured': event.is_featured,
-                'registration_deadline': event.registration_deadline.isoformat() if event.registration_deadline else None,
-                'can_register': event.registration_deadline and event.registration_deadline > datetime.utcnow() if event.registration_deadline else True
-            })
-        
-        return jsonify({
-            'events': events_data,
-            'pagination': {
+        if cursor is not None:
+            if cursor:
+                try:
+                    after_date, after_id = decode_cursor(cursor)
+                except (ValueError, TypeError):
+                    return jsonify({'message': 'Invalid cursor!'}), 400
+                query = query.filter(
+                    db.or_(
+                        Event.date_time > after_date,
+                        db.and_(Event.date_time == after_date, Event.id > after_id)
+                    )
+                )
+            
+            # Fetch one extra row to learn whether another page exists
+            events = query.order_by(Event.date_time.asc(), Event.id.asc()).limit(limit + 1).all()
+            has_more = len(events) > limit
+            events = events[:limit]
+            pagination = {
+                'limit': limit,
+                'next_cursor': encode_cursor(events[-1]) if has_more and events else None
+            }
+        else:
+            total_events = query.count()
+            # Search results are already ordered by relevance; date breaks ties
+            events = query.order_by(Event.date_time.asc(), Event.id.asc()).offset((page - 1) * limit).limit(limit).all()
+            pagination = {
                 'page': page,
                 'limit': limit,
                 'total': total_events,
                 'pages': (total_events + limit - 1) // limit
             }
+        
+        now = datetime.utcnow()
+        events_data = [serialize_event(event, now) for event in events]
+        
+        return jsonify({
+            'events': events_data,
+            'pagination': pagination
         })
         
     except Exception as e:
@@ -434,6 +1284,8 @@ def get_events():
         return jsonify({'message': 'Internal server error'}), 500
 
 @app.route('/events/featured', methods=['GET'])
+@replica_reads
+@response_cache.cached('events', versions=events_version)
 def get_featured_events():
     try:
         featured_events = Event.query.filter_by(
@@ -443,19 +1295,7 @@ def get_featured_events():
             Event.date_time >= datetime.utcnow()
         ).order_by(Event.date_time.asc()).limit(6).all()
         
-        events_data = []
-        for event in featured_events:
-            events_data.append({
-                'id': event.id,
-                'title': event.title,
-                'description': event.description[:100] + '...' if len(event.description) > 100 else event.description,
-                'category': event.category,
-                'date_time': event.date_time.isoformat(),
-                'venue': event.venue,
-                'image_url': event.image_url,
-                'current_participants': event.current_participants,
-                'max_participants': event.max_participants
-            })
+        events_data = [serialize_featured_event(event) for event in featured_events]
         
         return jsonify({'events': events_data})
         
@@ -463,51 +1303,30 @@ def get_featured_events():
         app.logger.error(f'Featured events error: {str(e)}')
         return jsonify({'message': 'Internal server error'}), 500
 
+def event_version(event_id):
+    user_id = token_user_id()
+    if user_id is None:
+        return get_versions('events') + (minute_bucket(),)
+    return (user_id,) + get_versions('events', f'registrations:{user_id}') + (minute_bucket(),)
+
 @app.route('/events/<int:event_id>', methods=['GET'])
+@replica_reads
+@conditional(event_version, private=True)
 def get_event(event_id):
     try:
-        event = Event.query.get_or_404(event_id)
+        event = Event.query.options(db.joinedload(Event.organizer)).get_or_404(event_id)
         
         # Check if user is registered (if authenticated)
         is_registered = False
-        token = request.headers.get('Authorization')
-        if token:
-            try:
-                token = token.split(' ')[1]
-                data = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
-                current_user = User.query.get(data['user_id'])
-                if current_user:
-                    registration = EventRegistration.query.filter_by(
-                        user_id=current_user.id, 
-                        event_id=event_id
-                    ).first()
-                    is_registered = bool(registration)
-            except:
-                pass
-        
-        event_data = {
-            'id': event.id,
-            'title': event.title,
-            'description': event.description,
-            'category': event.category,
-            'department': event.department,
-            'venue': event.venue,
-            'date_time': event.date_time.isoformat(),
-            'end_time': event.end_time.isoformat(),
-            'max_participants': event.max_participants,
-            'current_participants': event.current_participants,
-            'image_url': event.image_url,
-            'contact_email': event.contact_email,
-            'contact_phone': event.contact_phone,
-            'organizer': event.organizer.username,
-            'organizer_email': event.organizer.email,
-            'created_by': event.created_by,
-            'is_active': event.is_active,
-            'is_featured': event.is_featured,
-            'registration_deadline': event.registration_deadline.isoformat() if event.registration_deadline else None,
-            'is_registered': is_registered,
-            'can_register': event.registration_deadline and event.registration_deadline > datetime.utcnow() if event.registration_deadline else True
-        }
+        user_id = token_user_id()
+        if user_id is not None:
+            registration = EventRegistration.query.filter_by(
+                user_id=user_id, 
+                event_id=event_id
+            ).first()
+            is_registered = bool(registration)
+        
+        event_data = serialize_event_detail(event, is_registered)
         
         return jsonify({'event': event_data})
         
@@ -555,7 +1374,10 @@ def create_event(current_user):
         )
         
         db.session.add(event)
+        adjust_stats(event_stats(event))
+        bump_versions('events', f'created:{current_user.id}')
         db.session.commit()
+        response_cache.invalidate('events')
         
         app.logger.info(f'New event created: {event.title} by {current_user.username}')
         
@@ -582,6 +1404,7 @@ def update_event(current_user, event_id):
             return jsonify({'message': 'You can only edit your own events!'}), 403
         
         data = request.get_json()
+        stats_before = event_stats(event)
         
         event.title = data.get('title', event.title)
         event.description = data.get('description', event.description)
@@ -602,7 +1425,10 @@ def update_event(current_user, event_id):
         event.contact_phone = data.get('contact_phone', event.contact_phone)
         event.is_featured = data.get('is_featured', event.is_featured)
         
+        adjust_stats(stats_delta(event_stats(event), stats_before))
+        bump_versions('events')
         db.session.commit()
+        response_cache.invalidate('events')
         
         app.logger.info(f'Event updated: {event.title} by {current_user.username}')
         
@@ -621,21 +1447,34 @@ def delete_event(current_user, event_id):
         if event.created_by != current_user.id and not current_user.is_admin:
             return jsonify({'message': 'You can only delete your own events!'}), 403
         
-        # Create notifications for registered users
-        registrations = EventRegistration.query.filter_by(event_id=event_id).all()
-        for registration in registrations:
-            create_notification(
-                registration.user_id,
-                'Event Cancelled',
-                f'The event "{event.title}" has been cancelled.',
-                notification_type='warning'
-            )
+        # Certificates reference the event and are permanent records
+        if db.session.query(Certificate.query.filter_by(event_id=event_id).exists()).scalar():
+            return jsonify({'message': 'Events with issued certificates cannot be deleted!'}), 400
+        
+        # Notify registered users in one bulk insert, committed with the delete
+        registrants = audience_user_ids('event', event_id)
+        after_id = latest_notification_id()
+        fan_out_notifications(
+            registrants,
+            'Event Cancelled',
+            f'The event "{event.title}" has been cancelled.',
+            notification_type='warning'
+        )
+        bump_user_versions('registrations', registrants)
+        
+        # Earlier notifications are kept but no longer point at the event
+        bump_user_versions('notifications', db.select(Notification.user_id).where(Notification.event_id == event_id))
+        Notification.query.filter_by(event_id=event_id).update({Notification.event_id: None}, synchronize_session=False)
         
         # Delete all registrations for this event first
-        EventRegistration.query.filter_by(event_id=event_id).delete()
+        deleted_registrations = EventRegistration.query.filter_by(event_id=event_id).delete()
         
         db.session.delete(event)
+        adjust_stats(stats_delta({'registrations': -deleted_registrations}, event_stats(event)))
+        bump_versions('events', f'created:{event.created_by}')
         db.session.commit()
+        response_cache.invalidate('events')
+        push_notifications(after_id)
         
         app.logger.info(f'Event deleted: {event.title} by {current_user.username}')
         
@@ -664,28 +1503,31 @@ def register_for_event(current_user, event_id):
         if event.registration_deadline and event.registration_deadline < datetime.utcnow():
             return jsonify({'message': 'Registration deadline has passed!'}), 400
         
-        # Check if user is already registered
-        existing_registration = EventRegistration.query.filter_by(
-            user_id=current_user.id, 
-            event_id=event_id
-        ).first()
-        
-        if existing_registration:
-            return jsonify({'message': 'You are already registered for this event!'}), 400
-        
-        # Check if event is full
-        if event.max_participants and event.current_participants >= event.max_participants:
-            return jsonify({'message': 'This event is full!'}), 400
-        
+        # Insert the registration first: the unique constraint rejects duplicates
+        # and the flush takes the write lock before the seat is reserved
         registration = EventRegistration(
             user_id=current_user.id,
             event_id=event_id
         )
+        db.session.add(registration)
         
-        event.current_participants += 1
+        try:
+            db.session.flush()
+        except IntegrityError:
+            db.session.rollback()
+            return jsonify({'message': 'You are already registered for this event!'}), 400
         
-        db.session.add(registration)
+        # Atomically reserve a seat; no row updated means the event is full
+        if not reserve_seat(event_id):
+            db.session.rollback()
+            return jsonify({'message': 'This event is full!'}), 400
+        
+        bump_versions(f'registrations:{current_user.id}')
         db.session.commit()
+        # Every registration shares the global aggregate and listing version,
+        # so those are written behind; the student's own version moved above
+        deferred_counters.add({('stats', 'registrations'): 1, ('version', 'events'): 1})
+        response_cache.invalidate('events')
         
         # Create notification for user
         create_notification(
@@ -700,7 +1542,7 @@ def register_for_event(current_user, event_id):
         create_notification(
             event.created_by,
             'New Event Registration',
-            f'{current_user.username} has registered for your event "{event.title}".',
+            f'{stored_username(current_user.id)} has registered for your event "{event.title}".',
             event_id=event_id,
             notification_type='info'
         )
@@ -723,10 +1565,13 @@ def unregister_from_event(current_user, event_id):
         ).first_or_404()
         
         event = Event.query.get(event_id)
-        event.current_participants = max(0, event.current_participants - 1)
         
         db.session.delete(registration)
+        release_seat(event_id)
+        bump_versions(f'registrations:{current_user.id}')
         db.session.commit()
+        deferred_counters.add({('stats', 'registrations'): -1, ('version', 'events'): 1})
+        response_cache.invalidate('events')
         
         # Create notification for user
         create_notification(
@@ -745,43 +1590,21 @@ def unregister_from_event(current_user, event_id):
         return jsonify({'message': 'Internal server error'}), 500
 
 @app.route('/my-events', methods=['GET'])
+@replica_reads
 @token_required
+@conditional(lambda current_user: (current_user.id,) + get_versions('events', f'registrations:{current_user.id}'), private=True)
 def get_my_events(current_user):
     try:
         # Events created by user
         created_events = Event.query.filter_by(created_by=current_user.id).order_by(Event.date_time.desc()).all()
         
-        # Events user registered for
-        registrations = EventRegistration.query.filter_by(user_id=current_user.id).order_by(EventRegistration.registration_date.desc()).all()
-        registered_events = [registration.event for registration in registrations]
+        # Events user registered for, with each event and its organizer in the same query
+        registrations = EventRegistration.query.options(
+            db.joinedload(EventRegistration.event).joinedload(Event.organizer)
+        ).filter_by(user_id=current_user.id).order_by(EventRegistration.registration_date.desc()).all()
         
-        created_events_data = []
-        for event in created_events:
-            created_events_data.append({
-                'id': event.id,
-                'title': event.title,
-                'date_time': event.date_time.isoformat(),
-                'venue': event.venue,
-                'current_participants': event.current_participants,
-                'max_participants': event.max_participants,
-                'is_active': event.is_active,
-                'category': event.category
-            })
-        
-        registered_events_data = []
-        for event in registered_events:
-            registration = EventRegistration.query.filter_by(user_id=current_user.id, event_id=event.id).first()
-            registered_events_data.append({
-                'id': event.id,
-                'title': event.title,
-                'date_time': event.date_time.isoformat(),
-                'venue': event.venue,
-                'organizer': event.organizer.username,
-                'contact_email': event.contact_email,
-                'category': event.category,
-                'registration_date': registration.registration_date.isoformat(),
-                'attended': registration.attended
-            })
+        created_events_data = [serialize_created_event(event) for event in created_events]
+        registered_events_data = [serialize_registered_event(registration) for registration in registrations]
         
         return jsonify({
             'created_events': created_events_data,
@@ -794,7 +1617,9 @@ def get_my_events(current_user):
 
 # Notification Routes
 @app.route('/notifications', methods=['GET'])
+@replica_reads
 @token_required
+@conditional(lambda current_user: (current_user.id,) + get_versions(f'notifications:{current_user.id}'), private=True)
 def get_notifications(current_user):
     try:
         unread_only = request.args.get('unread_only', 'false').lower() == 'true'
@@ -807,20 +1632,10 @@ def get_notifications(current_user):
         
         notifications = query.order_by(Notification.created_at.desc()).limit(limit).all()
         
-        notifications_data = []
-        for notification in notifications:
-            notifications_data.append({
-                'id': notification.id,
-                'title': notification.title,
-                'message': notification.message,
-                'is_read': notification.is_read,
-                'created_at': notification.created_at.isoformat(),
-                'notification_type': notification.notification_type,
-                'event_id': notification.event_id
-            })
+        notifications_data = [serialize_notification(notification) for notification in notifications]
         
         # Get unread count
-        unread_count = Notification.query.filter_by(user_id=current_user.id, is_read=False).count()
+        unread_count = get_unread_count(current_user.id)
         
         return jsonify({
             'notifications': notifications_data,
@@ -831,14 +1646,75 @@ def get_notifications(current_user):
         app.logger.error(f'Get notifications error: {str(e)}')
         return jsonify({'message': 'Internal server error'}), 500
 
+@app.route('/notifications/stream', methods=['GET'])
+def stream_notifications():
+    # EventSource cannot send headers, so the token may come as ?token=
+    current_user, error = authenticate(bearer_token() or request.args.get('token'))
+    if error:
+        return error
+    
+    subscription = None
+    try:
+        # Subscribe before reading anything, so rows committed from here on
+        # are pushed by their writers
+        subscription = notification_broker.subscribe(current_user.id)
+        
+        # A reconnecting EventSource sends the last id it saw: replay the gap,
+        # skipping anything a writer has pushed meanwhile
+        missed = []
+        last_event_id = request.headers.get('Last-Event-ID', '')
+        if last_event_id.isdigit():
+            missed = [
+                notification for notification in Notification.query.filter(
+                    Notification.user_id == current_user.id,
+                    Notification.id > int(last_event_id)
+                ).order_by(Notification.id.asc()).limit(50)
+                if subscription.claim(notification.id)
+            ]
+        
+        unread_count = get_unread_count(current_user.id)
+        
+        initial = [format_sse('notification', serialize_notification(notification), notification.id) for notification in missed]
+        initial.append(format_sse('unread_count', {'unread_count': unread_count}))
+    except Exception as e:
+        if subscription:
+            notification_broker.unsubscribe(subscription)
+        app.logger.error(f'Notification stream error: {str(e)}')
+        return jsonify({'message': 'Internal server error'}), 500
+    
+    heartbeat = app.config['NOTIFICATION_STREAM_HEARTBEAT']
+    
+    # The generator runs after the request context (and its DB session) is gone
+    def generate():
+        try:
+            yield 'retry: 3000\n\n'
+            yield from initial
+            while True:
+                message = subscription.next_message(heartbeat)
+                if message is NotificationBroker.CLOSE:
+                    break
+                yield message if message is not None else ': heartbeat\n\n'
+        finally:
+            notification_broker.unsubscribe(subscription)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @app.route('/notifications/<int:notification_id>/read', methods=['PUT'])
 @token_required
 def mark_notification_read(current_user, notification_id):
     try:
         notification = Notification.query.filter_by(id=notification_id, user_id=current_user.id).first_or_404()
         
-        notification.is_read = True
-        db.session.commit()
+        # Conditional update so concurrent reads of the same row decrement once
+        marked = Notification.query.filter_by(id=notification.id, is_read=False).update({'is_read': True})
+        if marked:
+            adjust_unread_counts([current_user.id], -marked)
+            bump_versions(f'notifications:{current_user.id}')
+            db.session.commit()
+            push_unread_counts([current_user.id])
         
         return jsonify({'message': 'Notification marked as read!'})
         
@@ -850,8 +1726,12 @@ def mark_notification_read(current_user, notification_id):
 @token_required
 def mark_all_notifications_read(current_user):
     try:
-        Notification.query.filter_by(user_id=current_user.id, is_read=False).update({'is_read': True})
+        marked = Notification.query.filter_by(user_id=current_user.id, is_read=False).update({'is_read': True})
+        if marked:
+            adjust_unread_counts([current_user.id], -marked)
+        bump_versions(f'notifications:{current_user.id}')
         db.session.commit()
+        push_unread_counts([current_user.id])
         
         return jsonify({'message': 'All notifications marked as read!'})
         
@@ -861,6 +1741,7 @@ def mark_all_notifications_read(current_user):
 
 # Utility Routes
 @app.route('/categories', methods=['GET'])
+@response_cache.cached('static')
 def get_categories():
     categories = [
         'Technical',
@@ -877,6 +1758,7 @@ def get_categories():
     return jsonify({'categories': categories})
 
 @app.route('/departments', methods=['GET'])
+@response_cache.cached('static')
 def get_departments():
     departments = [
         'Computer Science and Engineering',
@@ -894,54 +1776,308 @@ def get_departments():
 @admin_required
 def get_stats(current_user):
     try:
-        total_users = User.query.count()
-        total_organizers = User.query.filter_by(is_organizer=True).count()
-        total_events = Event.query.count()
-        active_events = Event.query.filter_by(is_active=True).filter(Event.date_time >= datetime.utcnow()).count()
-        total_registrations = EventRegistration.query.count()
-        
-        # Recent events (last 7 days)
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent_events = Event.query.filter(Event.created_at >= week_ago).count()
+        # Maintained aggregates; fresh=true recomputes them from scratch
+        if request.args.get('fresh', 'false').lower() == 'true':
+            stats = recompute_stats()
+        else:
+            stats = read_stats()
         
         # Popular categories
-        category_stats = db.session.query(
-            Event.category,
-            db.func.count(Event.id).label('count')
-        ).group_by(Event.category).all()
+        category_stats = sorted(
+            (name[len('category:'):], count)
+            for name, count in stats.items()
+            if name.startswith('category:') and count > 0
+        )
         
         return jsonify({
-            'total_users': total_users,
-            'total_organizers': total_organizers,
-            'total_events': total_events,
-            'active_events': active_events,
-            'total_registrations': total_registrations,
-            'recent_events': recent_events,
-            'category_stats': [{'category': cat, 'count': count} for cat, count in category_stats]
+            'total_users': stats.get('users', 0),
+            'total_organizers': stats.get('organizers', 0),
+            'total_events': stats.get('events', 0),
+            'active_events': stats.get('active_events', 0),
+            'total_registrations': stats.get('registrations', 0),
+            'recent_events': stats.get('recent_events', 0),
+            'category_stats': [{'category': cat, 'count': count} for cat, count in category_stats],
+            'refreshed_at': datetime.utcfromtimestamp(stats['refreshed_at']).isoformat()
         })
         
     except Exception as e:
         app.logger.error(f'Get stats error: {str(e)}')
         return jsonify({'message': 'Internal server error'}), 500
 
+@app.route('/admin/users', methods=['GET'])
+@token_required
+@admin_required
+def get_all_users(current_user):
+    try:
+        department = request.args.get('department')
+        year = request.args.get('year')
+        role = request.args.get('role')
+        search = request.args.get('search')
+        limit = min(max(int(request.args.get('limit', 50)), 1), 200)
+        cursor = request.args.get('cursor')
+        
+        # Counts are correlated subqueries answered from the created_by and
+        # user_id indexes, so each page costs two index lookups per row
+        events_created = db.select(db.func.count()).where(Event.created_by == User.id).scalar_subquery()
+        events_registered = db.select(db.func.count()).where(EventRegistration.user_id == User.id).scalar_subquery()
+        query = db.select(User, events_created, events_registered).order_by(User.id).limit(limit + 1)
+        
+        if cursor:
+            try:
+                query = query.where(User.id > decode_user_cursor(cursor))
+            except (ValueError, TypeError):
+                return jsonify({'message': 'Invalid cursor!'}), 400
+        if department and department != 'all':
+            query = query.where(User.department == department)
+        if year and year != 'all':
+            query = query.where(User.year == year)
+        if role == 'admin':
+            query = query.where(User.is_admin == True)
+        elif role == 'organizer':
+            query = query.where(User.is_organizer == True)
+        elif role == 'student':
+            query = query.where(db.not_(User.is_organizer), db.not_(User.is_admin))
+        if search:
+            pattern = f'%{search.strip()}%'
+            query = query.where(db.or_(User.username.ilike(pattern), User.email.ilike(pattern)))
+        
+        rows = db.session.execute(query).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        return jsonify({
+            'users': [serialize_admin_user(user, events_created, events_registered) for user, events_created, events_registered in rows],
+            'pagination': {
+                'limit': limit,
+                'next_cursor': encode_user_cursor(rows[-1][0]) if has_more and rows else None
+            }
+        })
+        
+    except Exception as e:
+        app.logger.error(f'Get users error: {str(e)}')
+        return jsonify({'message': 'Internal server error'}), 500
+
+@app.route('/admin/events/<int:event_id>/attendance', methods=['PUT'])
+@token_required
+def update_event_attendance(current_user, event_id):
+    try:
+        event = Event.query.get_or_404(event_id)
+        
+        if event.created_by != current_user.id and not current_user.is_admin:
+            return jsonify({'message': 'You can only take attendance for your own events!'}), 403
+        
+        data = request.get_json(silent=True) or {}
+        attendance_updates = data.get('attendance')
+        if not isinstance(attendance_updates, list):
+            return jsonify({'message': 'attendance must be a list!'}), 400
+        
+        # Last entry wins when a user appears more than once
+        attendance = {}
+        for update in attendance_updates:
+            if not isinstance(update, dict) or type(update.get('user_id')) is not int or not isinstance(update.get('attended'), bool):
+                return jsonify({'message': 'Each entry needs an integer user_id and a boolean attended!'}), 400
+            attendance[update['user_id']] = update['attended']
+        
+        attended_ids = [user_id for user_id, attended in attendance.items() if attended]
+        absent_ids = [user_id for user_id, attended in attendance.items() if not attended]
+        
+        marked_attended, marked_absent, matched = apply_attendance(event_id, attended_ids, absent_ids)
+        db.session.commit()
+        
+        app.logger.info(f'Attendance updated for event {event_id} by {current_user.username}: {marked_attended} attended, {marked_absent} absent')
+        
+        return jsonify({
+            'message': 'Attendance updated successfully!',
+            'marked_attended': marked_attended,
+            'marked_absent': marked_absent,
+            'unchanged': matched - marked_attended - marked_absent,
+            'not_registered': len(attendance) - matched
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f'Update attendance error: {str(e)}')
+        return jsonify({'message': 'Internal server error'}), 500
+
+@app.route('/admin/events/<int:event_id>/registrations/export', methods=['GET'])
+@token_required
+def export_event_registrations(current_user, event_id):
+    try:
+        event = Event.query.get_or_404(event_id)
+        
+        if event.created_by != current_user.id and not current_user.is_admin:
+            return jsonify({'message': 'You can only export your own events!'}), 403
+        
+        fmt = request.args.get('format', 'csv').lower()
+        if fmt not in ('csv', 'xlsx'):
+            return jsonify({'message': 'format must be csv or xlsx!'}), 400
+        attended_only = request.args.get('attended', 'false').lower() == 'true'
+        
+        header = ['Registration ID', 'User ID', 'Username', 'Email', 'Department', 'Year', 'Registered At', 'Status', 'Attended']
+        query = db.select(
+            EventRegistration.id, User.id, User.username, User.email, User.department, User.year,
+            EventRegistration.registration_date, EventRegistration.status, EventRegistration.attended
+        ).join(User, User.id == EventRegistration.user_id).where(
+            EventRegistration.event_id == event_id
+        ).order_by(EventRegistration.id)
+        if attended_only:
+            query = query.where(EventRegistration.attended == True)
+        
+        # Rows come off a server-side cursor a batch at a time and go
+        # straight into the response; nothing is collected in memory
+        def rows():
+            result = db.session.execute(query.execution_options(yield_per=app.config['EXPORT_FETCH_SIZE']))
+            try:
+                for row in result:
+                    yield tuple(row)
+            finally:
+                result.close()
+        
+        name = f'event-{event_id}-{"attendance" if attended_only else "registrations"}'
+        if fmt == 'xlsx':
+            body = xlsx_stream(header, rows(), sheet_name='Attendance' if attended_only else 'Registrations')
+            mimetype = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        else:
+            body = csv_stream(header, rows())
+            mimetype = 'text/csv'
+        
+        app.logger.info(f'Registrations export ({fmt}) for event {event_id} by {current_user.username}')
+        
+        return Response(
+            stream_with_context(body),
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename={name}.{fmt}'}
+        )
+        
+    except Exception as e:
+        app.logger.error(f'Export registrations error: {str(e)}')
+        return jsonify({'message': 'Internal server error'}), 500
+
+@app.route('/admin/events/import', methods=['POST'])
+@token_required
+@admin_required
+def import_events_file(current_user):
+    try:
+        # Multipart upload (field "file") or the raw request body
+        upload = request.files.get('file')
+        if upload:
+            binary, filename = upload.stream, upload.filename
+        else:
+            binary, filename = request.stream, None
+        
+        fmt = request.args.get('format') or detect_format(filename, default=None)
+        if fmt is None:
+            fmt = 'jsonl' if 'json' in (request.mimetype or '') else 'csv'
+        if fmt not in ('csv', 'jsonl'):
+            return jsonify({'message': 'format must be csv or jsonl!'}), 400
+        
+        dry_run = request.args.get('dry_run', 'false').lower() == 'true'
+        chunk_size = min(max(int(request.args.get('chunk_size', 1000)), 1), 5000)
+        
+        report = import_events(
+            db, Event, text_stream(binary), fmt, current_user.id,
+            chunk_size=chunk_size, dry_run=dry_run, on_chunk=record_imported_events
+        )
+        if report['inserted'] and not dry_run:
+            response_cache.invalidate('events')
+        
+        app.logger.info(f'Event import by {current_user.username}: {report["inserted"]} inserted, {report["duplicates"]} duplicates, {report["error_count"]} errors, {report["rows_per_second"]} rows/sec')
+        
+        return jsonify({'message': 'Import finished!', 'report': report})
+        
+    except UnicodeDecodeError:
+        db.session.rollback()
+        return jsonify({'message': 'File must be UTF-8 encoded!'}), 400
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f'Event import error: {str(e)}')
+        return jsonify({'message': 'Internal server error'}), 500
+
+@app.route('/admin/notifications/broadcast', methods=['POST'])
+@token_required
+@admin_required
+def broadcast_notification(current_user):
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({'message': 'Request body must be a JSON object!'}), 400
+        
+        # Validation
+        for field in ['title', 'message']:
+            if not data.get(field) or not isinstance(data[field], str):
+                return jsonify({'message': f'{field} is required!'}), 400
+        
+        notification_type = data.get('notification_type', 'info')
+        if notification_type not in NOTIFICATION_TYPES:
+            return jsonify({'message': 'notification_type must be one of info, success, warning, error!'}), 400
+        
+        audience = data.get('audience', 'all')
+        audience_fields = {'all': None, 'event': 'event_id', 'department': 'department', 'year': 'year'}
+        if not isinstance(audience, str) or audience not in audience_fields:
+            return jsonify({'message': 'audience must be one of all, event, department, year!'}), 400
+        
+        value = None
+        if audience_fields[audience]:
+            value = data.get(audience_fields[audience])
+            if value is None:
+                return jsonify({'message': f'{audience_fields[audience]} is required!'}), 400
+        if audience == 'event':
+            # bool is an int subclass; true must not mean event 1
+            if not isinstance(value, int) or isinstance(value, bool):
+                return jsonify({'message': 'event_id must be an integer!'}), 400
+            if db.session.get(Event, value) is None:
+                return jsonify({'message': 'Event not found!'}), 400
+        elif value is not None and not isinstance(value, str):
+            return jsonify({'message': f'{audience_fields[audience]} must be a string!'}), 400
+        
+        after_id = latest_notification_id()
+        sent = fan_out_notifications(
+            audience_user_ids(audience, value),
+            data['title'],
+            data['message'],
+            event_id=value if audience == 'event' else None,
+            notification_type=notification_type
+        )
+        db.session.commit()
+        push_notifications(after_id)
+        
+        app.logger.info(f'Broadcast "{data["title"]}" sent to {sent} users ({audience}) by {current_user.username}')
+        
+        return jsonify({'message': 'Notification broadcast successfully!', 'sent': sent})
+        
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f'Broadcast notification error: {str(e)}')
+        return jsonify({'message': 'Internal server error'}), 500
+
+# Prometheus scrape target; keep it reachable from the monitoring network only
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return Response(request_metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/admin/cache', methods=['GET'])
+@token_required
+@admin_required
+def get_cache_stats(current_user):
+    return jsonify({
+        'response_cache': response_cache.stats(),
+        'principal_cache': principal_cache.stats(),
+        'profile_stats_cache': profile_stats_cache.stats(),
+        'read_replicas': replica_router.stats(),
+        'notification_streams': notification_broker.stats(),
+        'deferred_counters': deferred_counters.stats()
+    })
+
 # Certificate Routes
 @app.route('/certificates', methods=['GET'])
+@replica_reads
 @token_required
 def get_certificates(current_user):
     try:
-        certificates = Certificate.query.filter_by(user_id=current_user.id).all()
-        certificates_data = []
-        
-        for cert in certificates:
-            certificates_data.append({
-                'id': cert.id,
-                'event_id': cert.event_id,
-                'event_title': cert.event.title,
-                'issue_date': cert.issue_date.isoformat(),
-                'certificate_url': cert.certificate_url,
-                'event_category': cert.event.category,
-                'template_data': cert.template_data
-            })
+        certificates = Certificate.query.options(
+            db.joinedload(Certificate.event)
+        ).filter_by(user_id=current_user.id).all()
+        certificates_data = [serialize_certificate(cert) for cert in certificates]
         
         return jsonify({'certificates': certificates_data})
         
@@ -950,25 +2086,18 @@ def get_certificates(current_user):
         return jsonify({'message': 'Internal server error'}), 500
 
 @app.route('/certificates/<int:certificate_id>', methods=['GET'])
+@replica_reads
 @token_required
 def get_certificate(current_user, certificate_id):
     try:
-        certificate = Certificate.query.filter_by(
+        certificate = Certificate.query.options(
+            db.joinedload(Certificate.event)
+        ).filter_by(
             id=certificate_id, 
             user_id=current_user.id
         ).first_or_404()
         
-        return jsonify({
-            'certificate': {
-                'id': certificate.id,
-                'event_id': certificate.event_id,
-                'event_title': certificate.event.title,
-                'issue_date': certificate.issue_date.isoformat(),
-                'certificate_url': certificate.certificate_url,
-                'template_data': certificate.template_data,
-                'event_category': certificate.event.category
-            }
-        })
+        return jsonify({'certificate': serialize_certificate(certificate)})
         
     except Exception as e:
         app.logger.error(f'Get certificate error: {str(e)}')
@@ -999,38 +2128,70 @@ def generate_certificate(current_user, event_id):
             
         event = Event.query.get_or_404(event_id)
         
-        # Generate certificate (in a real app, this would create an actual PDF)
-        template_data = {
-            'participant_name': current_user.username,
-            'event_name': event.title,
-            'completion_date': datetime.utcnow().strftime('%B %d, %Y'),
-            'certificate_id': f'CERT-{event_id}-{current_user.id}-{int(datetime.utcnow().timestamp())}'
-        }
+        template_data = certificate_template_data(event, current_user.id, stored_username(current_user.id), datetime.utcnow())
         
+        # certificate_url is filled in once the PDF has been rendered
         certificate = Certificate(
             user_id=current_user.id,
             event_id=event_id,
-            certificate_url=f'/static/certificates/{template_data["certificate_id"]}.pdf',
-            template_data=template_data
+            template_data=template_data,
+            status='pending'
         )
         
         db.session.add(certificate)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # A concurrent request issued it first
+            db.session.rollback()
+            return jsonify({'message': 'Certificate already generated!'}), 400
+        certificate_renderer.submit(certificate.id, template_data)
         
         return jsonify({
-            'message': 'Certificate generated successfully!',
+            'message': 'Certificate is being generated!',
             'certificate': {
                 'id': certificate.id,
                 'event_title': event.title,
                 'issue_date': certificate.issue_date.isoformat(),
-                'certificate_url': certificate.certificate_url
+                'certificate_url': certificate.certificate_url,
+                'status': certificate.status
             }
-        })
+        }), 202
         
     except Exception as e:
         app.logger.error(f'Generate certificate error: {str(e)}')
         return jsonify({'message': 'Internal server error'}), 500
 
+@app.route('/admin/events/<int:event_id>/certificates', methods=['POST'])
+@token_required
+def issue_certificates(current_user, event_id):
+    try:
+        event = Event.query.get_or_404(event_id)
+        
+        if event.created_by != current_user.id and not current_user.is_admin:
+            return jsonify({'message': 'You can only issue certificates for your own events!'}), 403
+        
+        after_id = latest_notification_id()
+        certificates = issue_event_certificates(event)
+        db.session.commit()
+        push_notifications(after_id)
+        
+        # Render after commit so the renderer's status updates find the rows
+        for certificate_id, template_data in certificates:
+            certificate_renderer.submit(certificate_id, template_data)
+        
+        app.logger.info(f'{len(certificates)} certificates issued for event {event_id} by {current_user.username}')
+        
+        return jsonify({
+            'message': f'{len(certificates)} certificate(s) issued!',
+            'issued': len(certificates)
+        })
+        
+    except Exception as e:
+        db.session.rollback()
+        app.logger.error(f'Issue certificates error: {str(e)}')
+        return jsonify({'message': 'Internal server error'}), 500
+
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
@@ -1048,4 +2209,8 @@ def too_large(error):
 if __name__ == '__main__':
     # Initialize database before first request
     initialize_database()
+    password_hasher.start()
+    certificate_renderer.start()
+    render_pending_certificates()
+    start_stats_refresher(app.config['STATS_REFRESH_INTERVAL'])
     app.run(debug=True, host='localhost', port=5000)
\ No newline at end of file
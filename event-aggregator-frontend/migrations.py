@@ -0,0 +1,155 @@
+"""
+Versioned schema migrations
+db.create_all() only creates missing tables; it never touches tables that
+already exist, so indexes and columns added to the models never reach an
+existing events.db. Each migration here has a version number and a list
+of steps (SQL strings or callables taking a connection); applied versions
+are recorded in the schema_version table and every migration runs in its
+own transaction.
+
+Usage:
+    python migrations.py upgrade   # apply pending migrations
+    python migrations.py status    # list applied and pending migrations
+    python migrations.py check     # list hot queries whose plan is a full scan
+"""
+
+import sys
+from datetime import datetime
+
+from sqlalchemy import inspect
+from sqlalchemy.exc import DBAPIError
+
+SCHEMA_VERSION_DDL = """CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    description VARCHAR(200) NOT NULL,
+    applied_at TIMESTAMP NOT NULL
+)"""
+
+def add_column(table, column, ddl):
+    """Step adding a column, unless create_all() already made it on a fresh database"""
+    def step(connection):
+        if column not in {existing['name'] for existing in inspect(connection).get_columns(table)}:
+            connection.exec_driver_sql(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}')
+    return step
+
+# (version, description, steps). Never edit an applied migration; add a new one.
+MIGRATIONS = [
+    (1, 'Secondary indexes for hot query paths', [
+        'CREATE INDEX IF NOT EXISTS ix_event_active_date ON event (is_active, date_time)',
+        'CREATE INDEX IF NOT EXISTS ix_event_featured_date ON event (is_featured, date_time)',
+        'CREATE INDEX IF NOT EXISTS ix_event_created_by ON event (created_by)',
+        'CREATE INDEX IF NOT EXISTS ix_registration_user_date ON event_registration (user_id, registration_date)',
+        'CREATE INDEX IF NOT EXISTS ix_registration_event_attended ON event_registration (event_id, attended)',
+        'CREATE INDEX IF NOT EXISTS ix_notification_user_read_created ON notification (user_id, is_read, created_at)',
+        'CREATE INDEX IF NOT EXISTS ix_certificate_user ON certificate (user_id)',
+    ]),
+    (2, 'Certificate rendering status', [
+        # Existing certificates never had a file; pending makes startup render them
+        add_column('certificate', 'status', "VARCHAR(20) NOT NULL DEFAULT 'pending'"),
+    ]),
+    (3, 'One certificate per user and event', [
+        # Keep the first certificate of any duplicates left by concurrent requests
+        'DELETE FROM certificate WHERE id NOT IN (SELECT MIN(id) FROM certificate GROUP BY user_id, event_id)',
+        'CREATE UNIQUE INDEX IF NOT EXISTS uq_certificate_user_event ON certificate (user_id, event_id)',
+    ]),
+]
+
+def applied_versions(connection):
+    connection.exec_driver_sql(SCHEMA_VERSION_DDL)
+    return {row[0] for row in connection.exec_driver_sql('SELECT version FROM schema_version')}
+
+def run_migrations(db, verbose=False):
+    """Apply pending migrations in order; returns the versions applied"""
+    with db.engine.begin() as connection:
+        done = applied_versions(connection)
+
+    applied = []
+    for version, description, steps in MIGRATIONS:
+        if version in done:
+            continue
+        with db.engine.begin() as connection:
+            # Another process may have applied it since we looked
+            if version in applied_versions(connection):
+                continue
+            for step in steps:
+                if callable(step):
+                    step(connection)
+                else:
+                    connection.exec_driver_sql(step)
+            connection.exec_driver_sql(
+                'INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)'
+                if connection.dialect.paramstyle == 'qmark' else
+                'INSERT INTO schema_version (version, description, applied_at) VALUES (%s, %s, %s)',
+                (version, description, datetime.utcnow())
+            )
+        applied.append(version)
+        if verbose:
+            print(f'Applied migration {version}: {description}')
+    return applied
+
+def migration_status(db):
+    with db.engine.begin() as connection:
+        done = applied_versions(connection)
+    return [(version, description, version in done) for version, description, steps in MIGRATIONS]
+
+def hot_queries():
+    """The statements behind the busiest endpoints, as SQLAlchemy selects"""
+    from main import db, Event, EventRegistration, Notification, Certificate, DataVersion
+
+    now = datetime.utcnow()
+    return [
+        ('GET /events', db.select(Event).where(Event.is_active == True).order_by(Event.date_time, Event.id).limit(50)),
+        ('GET /events?upcoming', db.select(Event).where(Event.is_active == True, Event.date_time >= now).order_by(Event.date_time, Event.id).limit(50)),
+        ('GET /events/featured', db.select(Event).where(Event.is_active == True, Event.is_featured == True, Event.date_time >= now).order_by(Event.date_time).limit(6)),
+        ('GET /my-events (created)', db.select(Event).where(Event.created_by == 1).order_by(Event.date_time.desc())),
+        ('GET /my-events (registered)', db.select(EventRegistration).where(EventRegistration.user_id == 1).order_by(EventRegistration.registration_date.desc())),
+        ('GET /notifications', db.select(Notification).where(Notification.user_id == 1).order_by(Notification.created_at.desc()).limit(20)),
+        ('GET /notifications?unread_only', db.select(Notification).where(Notification.user_id == 1, Notification.is_read == False).order_by(Notification.created_at.desc()).limit(20)),
+        ('GET /certificates', db.select(Certificate).where(Certificate.user_id == 1)),
+        ('event registrants', db.select(EventRegistration.user_id).where(EventRegistration.event_id == 1)),
+        ('event attendees', db.select(EventRegistration.user_id).where(EventRegistration.event_id == 1, EventRegistration.attended == True)),
+        ('ETag versions', db.select(DataVersion).where(DataVersion.scope.in_(['events']))),
+    ]
+
+def full_scans(db):
+    """(name, plan line) for every hot query whose plan scans a whole table"""
+    dialect = db.engine.dialect.name
+    findings = []
+    with db.engine.connect() as connection:
+        for name, statement in hot_queries():
+            sql = str(statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+            try:
+                if dialect == 'sqlite':
+                    plan = [row[-1] for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}')]
+                    # "SCAN event" reads every row; "SEARCH ... USING INDEX" does not
+                    scans = [line for line in plan if line.startswith('SCAN ') and 'USING' not in line]
+                else:
+                    plan = [row[0] for row in connection.exec_driver_sql(f'EXPLAIN {sql}')]
+                    scans = [line.strip() for line in plan if 'Seq Scan' in line]
+            except DBAPIError as e:
+                connection.rollback()
+                scans = [f'cannot plan ({e.orig}); run "python migrations.py upgrade"']
+            findings.extend((name, line) for line in scans)
+    return findings
+
+if __name__ == '__main__':
+    from main import app, db
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'upgrade'
+    with app.app_context():
+        if command == 'upgrade':
+            db.create_all()
+            applied = run_migrations(db, verbose=True)
+            print(f'✅ Database is up to date ({len(applied)} migration(s) applied)')
+        elif command == 'status':
+            for version, description, done in migration_status(db):
+                print(f"  [{'x' if done else ' '}] {version:>3}  {description}")
+        elif command == 'check':
+            findings = full_scans(db)
+            for name, line in findings:
+                print(f'  {name}: {line}')
+            print(f'{"❌" if findings else "✅"} {len(findings)} full scan(s) on hot queries')
+            sys.exit(1 if findings else 0)
+        else:
+            print(__doc__)
+            sys.exit(2)
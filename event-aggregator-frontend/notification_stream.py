@@ -0,0 +1,128 @@
+"""
+Per-process registry of Server-Sent Events subscribers
+Each open /notifications/stream connection registers a Subscription with
+a bounded queue. Writers publish pre-formatted SSE messages to the users
+they touched, so idle clients cost nothing until something happens: no
+database poll per client.
+
+Queues are plain queue.Queue objects guarded by a threading lock, which
+behave correctly under threaded servers and under gevent once it has
+monkey-patched the standard library.
+"""
+
+import json
+import queue
+import threading
+from collections import deque
+
+def format_sse(event, data, event_id=None):
+    """Encode one SSE message"""
+    lines = []
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f'event: {event}')
+    lines.append(f'data: {json.dumps(data)}')
+    return '\n'.join(lines) + '\n\n'
+
+# Notification ids remembered per stream to drop duplicate pushes
+DELIVERED_HISTORY = 1000
+
+class Subscription:
+    def __init__(self, user_id, queue_size):
+        self.user_id = user_id
+        # Recently delivered notification ids. Not a high-water mark:
+        # concurrent transactions can commit ids out of order.
+        self._delivered = set()
+        self._delivered_order = deque()
+        self._lock = threading.Lock()
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.closed = False
+
+    def claim(self, event_id):
+        """True the first time event_id is claimed for delivery on this stream"""
+        with self._lock:
+            if event_id in self._delivered:
+                return False
+            self._delivered.add(event_id)
+            self._delivered_order.append(event_id)
+            if len(self._delivered_order) > DELIVERED_HISTORY:
+                self._delivered.discard(self._delivered_order.popleft())
+            return True
+
+    def next_message(self, timeout):
+        """Next SSE message, or None after timeout (time for a heartbeat)"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+class NotificationBroker:
+    # Put on a subscription's queue to make its stream end
+    CLOSE = object()
+
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        subscription = Subscription(user_id, self.queue_size)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.user_id]
+
+    def subscribed_users(self, user_ids=None):
+        """Ids of the users (of user_ids, default all) with an open stream"""
+        with self._lock:
+            if user_ids is None:
+                return list(self._subscriptions)
+            return [user_id for user_id in user_ids if user_id in self._subscriptions]
+
+    def publish(self, user_id, event, data, event_id=None):
+        """Queue an SSE message for every stream of user_id.
+
+        Messages carrying a notification id are skipped for streams that
+        already delivered it. A stream whose queue is full is closed; the
+        browser's EventSource reconnects and resyncs via Last-Event-ID.
+        """
+        message = format_sse(event, data, event_id)
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+        for subscription in subscriptions:
+            if subscription.closed:
+                continue
+            if event_id is not None and not subscription.claim(event_id):
+                continue
+            try:
+                subscription.queue.put_nowait(message)
+            except queue.Full:
+                self.close(subscription)
+
+    def close(self, subscription):
+        subscription.closed = True
+        self.unsubscribe(subscription)
+        # Make room for the close marker so the stream wakes up and ends
+        while True:
+            try:
+                subscription.queue.put_nowait(self.CLOSE)
+                return
+            except queue.Full:
+                try:
+                    subscription.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                'users': len(self._subscriptions),
+                'streams': sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+            }
@@ -0,0 +1,79 @@
+"""
+Password hashing off the request threads
+bcrypt is deliberately slow (~250 ms per call at the default work factor)
+and holds a worker thread the whole time. PasswordHasher runs hashing and
+verification in a dedicated process pool so login storms use every core,
+and rejects work immediately once its bounded queue is full instead of
+letting requests pile up behind it.
+
+Hashes are standard $2b$ bcrypt strings, interchangeable with the ones
+Flask-Bcrypt produces in the seed scripts.
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+
+import bcrypt
+
+class HasherBusy(Exception):
+    """Raised when the hashing queue is saturated"""
+
+def _hash_password(password, rounds):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+def _check_password(pw_hash, password):
+    return bcrypt.checkpw(password.encode('utf-8'), pw_hash.encode('utf-8'))
+
+class PasswordHasher:
+    def __init__(self, workers=2, max_pending=8, rounds=12, timeout=10):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def start(self):
+        """Spawn the worker processes up front instead of on the first login"""
+        if self.workers:
+            list(self._pool().map(_hash_password, ['warmup'] * self.workers, [4] * self.workers))
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _run(self, fn, *args):
+        # workers=0 hashes inline, e.g. for scripts and debugging
+        if not self.workers:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy('Password hashing queue is full')
+        try:
+            future = self._pool().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is held until the job leaves the pool, not until the caller
+        # gives up waiting, so timed-out jobs still count against the queue
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            # Drop the job if it hasn't started yet
+            future.cancel()
+            raise
+
+    def hash(self, password):
+        return self._run(_hash_password, password, self.rounds)
+
+    def check(self, pw_hash, password):
+        return self._run(_check_password, pw_hash, password)
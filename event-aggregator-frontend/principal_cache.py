@@ -0,0 +1,109 @@
+"""
+Authenticated principal cache for token_required
+Resolving a token to a user used to cost a User query on every request.
+A Principal carries just the identity and roles handlers need; it is
+cached per (user id, token) in a bounded LRU with a TTL, and can be built
+straight from signed role claims in recently issued tokens.
+
+Profile and role changes call invalidate(), which drops the user's cached
+principals and stops trusting claims in tokens issued before the change.
+The TTL and the claims max age bound staleness across worker processes;
+a principal built from claims is never cached past the claims max age.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+class Principal:
+    """Identity and roles of the authenticated user"""
+
+    def __init__(self, id, username, is_admin=False, is_organizer=False):
+        self.id = id
+        self.username = username
+        self.is_admin = bool(is_admin)
+        self.is_organizer = bool(is_organizer)
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(user.id, user.username, user.is_admin, user.is_organizer)
+
+    def __repr__(self):
+        return f'<Principal {self.id} {self.username}>'
+
+class PrincipalCache:
+    def __init__(self, maxsize=4096, ttl=300, claims_max_age=900, clock=time.time, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.claims_max_age = claims_max_age
+        # clock: wall time, compared with token iat; timer: for entry TTLs
+        self.clock = clock
+        self.timer = timer
+        self._entries = OrderedDict()
+        self._revoked_at = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.claims = 0
+
+    def get(self, user_id, token):
+        with self._lock:
+            entry = self._entries.get((user_id, token))
+            if entry is None or entry[1] < self.timer():
+                if entry is not None:
+                    del self._entries[(user_id, token)]
+                self.misses += 1
+                return None
+            self._entries.move_to_end((user_id, token))
+            self.hits += 1
+            return entry[0]
+
+    def set(self, token, principal, claims_issued_at=None):
+        """Cache principal; pass the token's iat if it was built from role claims"""
+        ttl = self.ttl
+        if claims_issued_at is not None:
+            ttl = min(ttl, claims_issued_at + self.claims_max_age - self.clock())
+            if ttl <= 0:
+                return
+        with self._lock:
+            self._entries[(principal.id, token)] = (principal, self.timer() + ttl)
+            self._entries.move_to_end((principal.id, token))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def from_claims(self, data):
+        """Principal built from signed role claims, or None if they can't be trusted"""
+        if not self.claims_max_age or 'roles' not in data or 'iat' not in data:
+            return None
+        if data['iat'] + self.claims_max_age < self.clock():
+            return None
+        with self._lock:
+            revoked_at = self._revoked_at.get(data['user_id'])
+            if revoked_at is not None and data['iat'] <= revoked_at:
+                return None
+            self.claims += 1
+        roles = data['roles']
+        return Principal(
+            data['user_id'],
+            data.get('username'),
+            is_admin='admin' in roles,
+            is_organizer='organizer' in roles
+        )
+
+    def invalidate(self, user_id):
+        """Forget cached principals and stop trusting older claims for user_id"""
+        with self._lock:
+            self._revoked_at[user_id] = self.clock()
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'claims': self.claims
+            }
@@ -0,0 +1,88 @@
+"""
+SQL statement counting and N+1 detection
+QueryStats collects every statement a unit of work (a request, or a
+block of code under track_queries()) sends to the database, with the
+time spent in it. Statements are counted by their exact SQL text, which
+SQLAlchemy already renders with bind placeholders; shapes are only
+normalized when a report is asked for, so recording stays a dict
+increment.
+
+The same shape running many times in one unit of work is the signature
+of an N+1 pattern: a query per row of an earlier result. Batched
+statements (executemany, IN lists of several values, multi-row VALUES)
+are left out of that check: a chunked update or import repeats its shape
+once per chunk, not once per row.
+
+    with track_queries() as stats:
+        client.get('/events')
+    assert stats.count <= 3, stats.report()
+"""
+
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+PLACEHOLDER = r'\s*(?:\?|%\(\w+\)s|%s|:\w+|__\[POSTCOMPILE_\w+\])\s*'
+# "IN (?, ?, ?)" and "IN (__[POSTCOMPILE_x])" collapse to one shape whatever the list size
+IN_LIST = re.compile(rf'\bIN \((?:{PLACEHOLDER},?)+\)', re.IGNORECASE)
+# An IN list of two or more values, or an INSERT of two or more rows
+BATCHED = re.compile(rf'\bIN \({PLACEHOLDER},|\bVALUES\s*\([^()]*\)\s*,\s*\(', re.IGNORECASE)
+NUMBER = re.compile(r'\b\d+\b')
+WHITESPACE = re.compile(r'\s+')
+
+def is_batched(statement):
+    return BATCHED.search(statement) is not None
+
+def statement_shape(statement):
+    shape = WHITESPACE.sub(' ', statement).strip()
+    shape = IN_LIST.sub('IN (...)', shape)
+    return NUMBER.sub('?', shape)
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.statements = Counter()
+        self.executemany = set()
+
+    def record(self, statement, elapsed, executemany=False):
+        self.count += 1
+        self.time += elapsed
+        self.statements[statement] += 1
+        if executemany:
+            self.executemany.add(statement)
+
+    def shapes(self, batched=True):
+        shapes = Counter()
+        for statement, count in self.statements.items():
+            if batched or not (statement in self.executemany or is_batched(statement)):
+                shapes[statement_shape(statement)] += count
+        return shapes
+
+    def repeated(self, threshold):
+        """(count, shape) for per-row shapes run at least threshold times, most frequent first"""
+        if self.count < threshold:
+            return []
+        return [(count, shape) for shape, count in self.shapes(batched=False).most_common() if count >= threshold]
+
+    def report(self, limit=5):
+        lines = [f'{self.count} statement(s), {self.time * 1000:.1f} ms']
+        lines.extend(f'  {count}x {shape[:200]}' for shape, count in self.shapes().most_common(limit))
+        return '\n'.join(lines)
+
+_local = threading.local()
+
+def active_trackers():
+    return getattr(_local, 'trackers', ())
+
+@contextmanager
+def track_queries():
+    """Collect the statements run by this thread inside the block"""
+    stats = QueryStats()
+    previous = active_trackers()
+    _local.trackers = previous + (stats,)
+    try:
+        yield stats
+    finally:
+        _local.trackers = previous
@@ -0,0 +1,90 @@
+"""
+Read/write splitting between the primary database and read replicas
+Endpoints opt in by pinning a replica on the request's session;
+RoutingSession then sends that session's plain SELECTs to the replica and
+everything else (flushes, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE,
+raw SQL) to the primary. The first write unpins the replica, so a
+read-modify-write path reads what it is about to change from the primary.
+
+Replicas lag the primary, so ReplicaRouter keeps a client on the primary
+for a short window after each of their writes (read-your-writes): a
+student who just registered sees the registration on their next page
+load. The window travels with the client as a signed marker (a cookie
+holding the time it ends), so it holds whichever worker process or host
+serves the next read. It should exceed the replication lag.
+"""
+
+import itertools
+import threading
+import time
+
+from flask_sqlalchemy.session import Session
+from itsdangerous import BadSignature, Signer
+
+REPLICA_INFO_KEY = 'read_replica'
+STICKY_COOKIE = 'primary_reads'
+
+def pin_replica(session, engine):
+    session.info[REPLICA_INFO_KEY] = engine
+
+def unpin_replica(session):
+    session.info.pop(REPLICA_INFO_KEY, None)
+
+class RoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        replica = self.info.get(REPLICA_INFO_KEY)
+        if replica is not None and bind is None:
+            if (not self._flushing and clause is not None and clause.is_select
+                    and getattr(clause, '_for_update_arg', None) is None):
+                return replica
+            # A write: stay on the primary for the rest of the unit of work
+            del self.info[REPLICA_INFO_KEY]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+class ReplicaRouter:
+    def __init__(self, replicas, secret_key, sticky_seconds=5, clock=time.time):
+        self.replicas = list(replicas)
+        self.sticky_seconds = sticky_seconds
+        # Wall clock: markers are compared across processes and hosts
+        self.clock = clock
+        self._signer = Signer(secret_key, salt='read-your-writes')
+        self._next = itertools.cycle(self.replicas) if self.replicas else None
+        self._lock = threading.Lock()
+        self.replica_reads = 0
+        self.sticky_reads = 0
+
+    @property
+    def enabled(self):
+        return bool(self.replicas)
+
+    def write_marker(self):
+        """Signed marker for the writer's client: read from the primary until sticky_seconds from now"""
+        return self._signer.sign(f'{self.clock() + self.sticky_seconds:.3f}').decode()
+
+    def _primary_until(self, marker):
+        try:
+            return float(self._signer.unsign(marker))
+        except (BadSignature, ValueError):
+            return 0
+
+    def choose(self, marker=None):
+        """Replica engine for this request's reads, or None to read from the primary"""
+        if not self.replicas:
+            return None
+        sticky = marker is not None and self._primary_until(marker) > self.clock()
+        with self._lock:
+            if sticky:
+                self.sticky_reads += 1
+                return None
+            self.replica_reads += 1
+            return next(self._next)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'replicas': len(self.replicas),
+                'sticky_seconds': self.sticky_seconds,
+                'replica_reads': self.replica_reads,
+                'sticky_reads': self.sticky_reads
+            }
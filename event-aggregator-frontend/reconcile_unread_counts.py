@@ -0,0 +1,63 @@
+"""
+Repair drift in the denormalized unread notification counters
+Recomputes every user's unread count from the notification table with a
+single grouped query, reports the users whose stored counter disagreed
+(or was never initialized) and rewrites all counters in one statement.
+
+Run it after upgrading an existing database, or any time the navbar badge
+and the notification list disagree:
+    python reconcile_unread_counts.py
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import app, db, User, Notification, NotificationCounter, upsert_insert
+
+def reconcile_unread_counts():
+    """Rewrite all unread counters from the source of truth"""
+    with app.app_context():
+        actual = db.select(
+            Notification.user_id.label('user_id'),
+            db.func.count(Notification.id).label('unread')
+        ).where(Notification.is_read == False).group_by(Notification.user_id).subquery()
+        
+        expected = db.func.coalesce(actual.c.unread, 0)
+        truth = db.select(
+            User.id.label('user_id'),
+            expected.label('unread')
+        ).outerjoin(actual, actual.c.user_id == User.id)
+        
+        # Users whose stored counter is wrong or missing
+        drifted = db.session.execute(
+            truth.add_columns(NotificationCounter.unread.label('stored')).outerjoin(
+                NotificationCounter, NotificationCounter.user_id == User.id
+            ).where(
+                db.or_(NotificationCounter.unread == None, NotificationCounter.unread != expected)
+            )
+        ).all()
+        
+        statement = upsert_insert(NotificationCounter)
+        if statement is not None:
+            statement = statement.from_select(['user_id', 'unread'], truth.where(db.true()))
+            db.session.execute(statement.on_conflict_do_update(
+                index_elements=['user_id'],
+                set_={'unread': statement.excluded.unread}
+            ))
+        else:
+            NotificationCounter.query.delete()
+            db.session.execute(db.insert(NotificationCounter).from_select(['user_id', 'unread'], truth))
+        db.session.commit()
+        
+        for user_id, unread, stored in drifted[:20]:
+            print(f"  user {user_id}: stored {stored if stored is not None else 'missing'}, actual {unread}")
+        if len(drifted) > 20:
+            print(f"  ... and {len(drifted) - 20} more")
+        print(f"✅ Reconciled unread counters: {len(drifted)} repaired")
+        
+        return len(drifted)
+
+if __name__ == '__main__':
+    reconcile_unread_counts()
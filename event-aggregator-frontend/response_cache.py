@@ -0,0 +1,127 @@
+"""
+In-process response cache for anonymous, read-heavy endpoints
+Entries are keyed on the request path plus the normalized query string,
+evicted LRU once the cache is full and expired after a TTL. Every entry
+carries a tag (e.g. 'events') so writes can drop exactly the listings
+they affect instead of flushing everything. Invalidation only reaches
+the process that wrote, so endpoints can also pass the version counters
+their data is built from: those are part of the key, and a write in any
+process moves readers to a new entry. With read replicas, settle
+keeps responses built right after an invalidation out of the cache, as
+they may have been read from a replica that has not seen the write yet.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import request, make_response
+
+class ResponseCache:
+    def __init__(self, maxsize=512, ttl=30, settle=0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.settle = settle
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._invalidated_at = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key():
+        """Path plus sorted query arguments, so ?a=1&b=2 and ?b=2&a=1 share an entry"""
+        args = sorted((key, value) for key in request.args for value in request.args.getlist(key))
+        return request.path, tuple(args)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry['expires'] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key, tag, generation, body, mimetype):
+        with self._lock:
+            # A write to this tag happened while the response was being built
+            if self._generations.get(tag, 0) != generation:
+                return
+            # Too soon after a write for every replica to have it
+            if tag in self._invalidated_at and time.monotonic() - self._invalidated_at[tag] < self.settle:
+                return
+            self._entries[key] = {
+                'tag': tag,
+                'body': body,
+                'mimetype': mimetype,
+                'expires': time.monotonic() + self.ttl
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def generation(self, tag):
+        with self._lock:
+            return self._generations.get(tag, 0)
+
+    def invalidate(self, tag):
+        """Drop every entry carrying tag"""
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            self._invalidated_at[tag] = time.monotonic()
+            stale = [key for key, entry in self._entries.items() if entry['tag'] == tag]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'settle': self.settle,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+
+    def cached(self, tag, versions=None):
+        """Route decorator serving successful responses from the cache.
+
+        versions, if given, returns the current version counters (a tuple)
+        of the data behind the response; entries are keyed on them too.
+        """
+        def decorator(f):
+            @wraps(f)
+            def decorated(*args, **kwargs):
+                key = self.make_key()
+                if versions is not None:
+                    key += (versions(),)
+                entry = self.get(key)
+                if entry is not None:
+                    response = make_response(entry['body'])
+                    response.mimetype = entry['mimetype']
+                    response.headers['X-Cache'] = 'HIT'
+                    return response
+
+                generation = self.generation(tag)
+                response = make_response(f(*args, **kwargs))
+                if response.status_code == 200:
+                    self.set(key, tag, generation, response.get_data(), response.mimetype)
+                response.headers['X-Cache'] = 'MISS'
+                return response
+            return decorated
+        return decorator
@@ -0,0 +1,127 @@
+"""
+Full-text search index for events
+Keeps a ranked, prefix-matching index over Event.title, Event.description
+and Event.venue so GET /events?search= no longer scans the whole table.
+
+SQLite uses an external-content FTS5 table kept in sync by triggers, so
+every writer (API routes and seed scripts alike) updates the index.
+PostgreSQL uses a GIN expression index with tsvector matching. Any other
+backend falls back to the original ILIKE filters.
+"""
+
+import re
+import threading
+
+from sqlalchemy import column, table
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+# Lightweight handle on the FTS5 table (kept out of db.metadata on purpose,
+# db.create_all() must never try to create it as a regular table)
+event_fts = table('event_fts', column('rowid'), column('rank'))
+
+SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS event_fts USING fts5(
+        title, description, venue,
+        content='event', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS event_fts_ai AFTER INSERT ON event BEGIN
+        INSERT INTO event_fts(rowid, title, description, venue)
+        VALUES (new.id, new.title, new.description, new.venue);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS event_fts_ad AFTER DELETE ON event BEGIN
+        INSERT INTO event_fts(event_fts, rowid, title, description, venue)
+        VALUES ('delete', old.id, old.title, old.description, old.venue);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS event_fts_au AFTER UPDATE OF title, description, venue ON event BEGIN
+        INSERT INTO event_fts(event_fts, rowid, title, description, venue)
+        VALUES ('delete', old.id, old.title, old.description, old.venue);
+        INSERT INTO event_fts(rowid, title, description, venue)
+        VALUES (new.id, new.title, new.description, new.venue);
+    END""",
+]
+
+POSTGRES_DOCUMENT = "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, '') || ' ' || coalesce(venue, ''))"
+
+POSTGRES_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_event_search ON event USING GIN ({POSTGRES_DOCUMENT})",
+]
+
+_state = {'backend': None}
+_lock = threading.Lock()
+
+def tokenize(search):
+    """Split a raw search string into lowercase word tokens"""
+    return re.findall(r'\w+', search.lower())
+
+def ensure_search_index(db):
+    """Create the search index for the current backend (idempotent)"""
+    with _lock:
+        dialect = db.engine.dialect.name
+        backend = 'like'
+        try:
+            if dialect == 'sqlite':
+                with db.engine.begin() as connection:
+                    exists = connection.exec_driver_sql(
+                        "SELECT 1 FROM sqlite_master WHERE name = 'event_fts'"
+                    ).first()
+                    for statement in SQLITE_DDL:
+                        connection.exec_driver_sql(statement)
+                    # Index rows that existed before the FTS table did
+                    if not exists:
+                        connection.exec_driver_sql("INSERT INTO event_fts(event_fts) VALUES ('rebuild')")
+                backend = 'fts5'
+            elif dialect == 'postgresql':
+                with db.engine.begin() as connection:
+                    for statement in POSTGRES_DDL:
+                        connection.exec_driver_sql(statement)
+                backend = 'tsvector'
+        except (OperationalError, ProgrammingError):
+            # FTS5 not compiled in, or insufficient privileges: keep ILIKE
+            backend = 'like'
+        _state['backend'] = backend
+        return backend
+
+def search_backend(db):
+    """Return the active search backend, creating the index on first use"""
+    if _state['backend'] is None:
+        ensure_search_index(db)
+    return _state['backend']
+
+def apply_search(db, query, model, search, ranked=True):
+    """Filter query to events matching search, most relevant first.
+
+    Pass ranked=False to filter only and leave ordering to the caller.
+    """
+    tokens = tokenize(search)
+    # Punctuation-only searches have nothing to index; match them literally
+    backend = search_backend(db) if tokens else 'like'
+
+    if backend == 'fts5':
+        # Every token must match; the last one may be a partial word
+        expression = ' '.join(f'"{token}"' for token in tokens[:-1])
+        expression = f'{expression} "{tokens[-1]}"*'.strip()
+        query = query.join(event_fts, event_fts.c.rowid == model.id).filter(
+            db.literal_column('event_fts').op('MATCH')(expression)
+        )
+        if ranked:
+            query = query.order_by(event_fts.c.rank)
+        return query
+
+    if backend == 'tsvector':
+        expression = ' & '.join(tokens[:-1] + [f'{tokens[-1]}:*'])
+        document = db.literal_column(POSTGRES_DOCUMENT)
+        ts_query = db.func.to_tsquery('simple', expression)
+        query = query.filter(document.op('@@')(ts_query))
+        if ranked:
+            query = query.order_by(db.func.ts_rank(document, ts_query).desc())
+        return query
+
+    query = query.filter(
+        db.or_(
+            model.title.ilike(f'%{search}%'),
+            model.description.ilike(f'%{search}%'),
+            model.venue.ilike(f'%{search}%')
+        )
+    )
+    return query
@@ -0,0 +1,137 @@
+"""
+Shared JSON serializers for Event, EventRegistration, Notification,
+Certificate and User payloads.
+
+These functions only read attributes, they never query. Callers load the
+relationships they touch up front (joinedload/selectinload on the listing
+query) so every endpoint runs a constant number of SQL statements no
+matter how many rows it returns.
+"""
+
+from datetime import datetime
+
+def isoformat(value):
+    """ISO-8601 string for a datetime, or None"""
+    return value.isoformat() if value else None
+
+def can_register(event, now=None):
+    """Registration stays open until the deadline, or forever without one"""
+    if not event.registration_deadline:
+        return True
+    return event.registration_deadline > (now or datetime.utcnow())
+
+def serialize_event(event, now=None):
+    """Full listing payload; needs event.organizer loaded"""
+    return {
+        'id': event.id,
+        'title': event.title,
+        'description': event.description,
+        'category': event.category,
+        'department': event.department,
+        'venue': event.venue,
+        'date_time': event.date_time.isoformat(),
+        'end_time': event.end_time.isoformat(),
+        'max_participants': event.max_participants,
+        'current_participants': event.current_participants,
+        'image_url': event.image_url,
+        'contact_email': event.contact_email,
+        'contact_phone': event.contact_phone,
+        'organizer': event.organizer.username,
+        'created_by': event.created_by,
+        'is_featured': event.is_featured,
+        'registration_deadline': isoformat(event.registration_deadline),
+        'can_register': can_register(event, now)
+    }
+
+def serialize_event_detail(event, is_registered=False, now=None):
+    """Single event payload; needs event.organizer loaded"""
+    event_data = serialize_event(event, now)
+    event_data.update({
+        'organizer_email': event.organizer.email,
+        'is_active': event.is_active,
+        'is_registered': is_registered
+    })
+    return event_data
+
+def serialize_featured_event(event):
+    """Compact card payload for the featured carousel"""
+    description = event.description
+    return {
+        'id': event.id,
+        'title': event.title,
+        'description': description[:100] + '...' if len(description) > 100 else description,
+        'category': event.category,
+        'date_time': event.date_time.isoformat(),
+        'venue': event.venue,
+        'image_url': event.image_url,
+        'current_participants': event.current_participants,
+        'max_participants': event.max_participants
+    }
+
+def serialize_created_event(event):
+    """Organizer's own event as shown on the dashboard"""
+    return {
+        'id': event.id,
+        'title': event.title,
+        'date_time': event.date_time.isoformat(),
+        'venue': event.venue,
+        'current_participants': event.current_participants,
+        'max_participants': event.max_participants,
+        'is_active': event.is_active,
+        'category': event.category
+    }
+
+def serialize_registered_event(registration):
+    """Registered event with registration details; needs
+    registration.event and registration.event.organizer loaded"""
+    event = registration.event
+    return {
+        'id': event.id,
+        'title': event.title,
+        'date_time': event.date_time.isoformat(),
+        'venue': event.venue,
+        'organizer': event.organizer.username,
+        'contact_email': event.contact_email,
+        'category': event.category,
+        'registration_date': registration.registration_date.isoformat(),
+        'attended': registration.attended
+    }
+
+def serialize_notification(notification):
+    return {
+        'id': notification.id,
+        'title': notification.title,
+        'message': notification.message,
+        'is_read': notification.is_read,
+        'created_at': notification.created_at.isoformat(),
+        'notification_type': notification.notification_type,
+        'event_id': notification.event_id
+    }
+
+def serialize_certificate(certificate):
+    """Certificate payload; needs certificate.event loaded"""
+    return {
+        'id': certificate.id,
+        'event_id': certificate.event_id,
+        'event_title': certificate.event.title,
+        'issue_date': certificate.issue_date.isoformat(),
+        'certificate_url': certificate.certificate_url,
+        'status': certificate.status,
+        'event_category': certificate.event.category,
+        'template_data': certificate.template_data
+    }
+
+def serialize_admin_user(user, events_created, events_registered):
+    """Admin listing payload; the counts come from the listing query"""
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'department': user.department,
+        'year': user.year,
+        'is_organizer': user.is_organizer,
+        'is_admin': user.is_admin,
+        'created_at': isoformat(user.created_at),
+        'events_created': events_created,
+        'events_registered': events_registered
+    }
@@ -4,6 +4,8 @@ const BASE_URL = 'http://localhost:5000';
 
 export const authAPI = axios.create({
   baseURL: BASE_URL,
+  // Sends the API's read-your-writes cookie back after a write
+  withCredentials: true,
   headers: {
     'Content-Type': 'application/json',
   },
@@ -0,0 +1,106 @@
+"""
+Shared fixtures
+main is imported against a scratch SQLite database (DATABASE_URL must be
+set before the import) and from a scratch working directory, so app.log
+and uploads stay out of the tree; rendered certificates are written to
+the scratch directory too (the renderer's default is the static folder). The database is
+shared by the whole session; fixtures create uniquely named rows so tests
+don't depend on each other.
+"""
+
+import itertools
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKDIR = tempfile.mkdtemp(prefix='event-aggregator-tests-')
+sys.path.insert(0, ROOT)
+os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(WORKDIR, "events.db")}'
+os.environ.pop('DATABASE_REPLICA_URLS', None)
+# The stress tests queue dozens of threads on SQLite's single writer, whose
+# busy handler is not fair: give a starved writer longer than production
+os.environ['SQLITE_BUSY_TIMEOUT'] = '30000'
+os.chdir(WORKDIR)
+
+import main
+from query_counter import track_queries
+
+_sequence = itertools.count(1)
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'slow: long-running stress tests (deselect with -m "not slow")')
+
+def auth(token):
+    return {'Authorization': f'Bearer {token}'}
+
+class Clock:
+    """Manually advanced stand-in for time.time / time.monotonic"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture(scope='session')
+def app():
+    main.app.logger.disabled = True
+    main.certificate_renderer.directory = os.path.join(WORKDIR, 'certificates')
+    main.initialize_database()
+    return main.app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def make_users(app):
+    """make_users(count) -> [(user_id, token)] for new students"""
+    def make(count, **fields):
+        with app.app_context():
+            users = []
+            for _ in range(count):
+                n = next(_sequence)
+                users.append(main.User(
+                    username=f'test_student{n}', email=f'test_student{n}@college.edu', password='x',
+                    department='Computer Science and Engineering', year='2nd Year', **fields
+                ))
+            main.db.session.add_all(users)
+            main.db.session.commit()
+            return [(user.id, main.generate_token(user)) for user in users]
+    return make
+
+@pytest.fixture
+def make_event(app):
+    """make_event(created_by, **columns) -> id of a new upcoming event"""
+    def make(created_by, **fields):
+        starts = datetime.utcnow() + timedelta(days=7)
+        values = {
+            'title': f'Test Event {next(_sequence)}', 'description': 'Created by the test suite',
+            'category': 'Technical', 'department': 'All Departments', 'venue': 'Main Auditorium',
+            'date_time': starts, 'end_time': starts + timedelta(hours=3), 'current_participants': 0,
+            'contact_email': 'events@college.edu', 'created_by': created_by
+        }
+        values.update(fields)
+        with app.app_context():
+            event = main.Event(**values)
+            main.db.session.add(event)
+            main.db.session.commit()
+            return event.id
+    return make
+
+@pytest.fixture
+def query_budget(app):
+    """with query_budget(limit) as stats: fails if the block runs more than limit statements or a per-row N+1 shape"""
+    @contextmanager
+    def budget(limit):
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= limit, stats.report()
+        assert not stats.repeated(app.config['N_PLUS_ONE_THRESHOLD']), stats.report()
+    return budget
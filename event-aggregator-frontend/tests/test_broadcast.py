@@ -0,0 +1,38 @@
+import pytest
+
+import main
+from conftest import auth
+
+@pytest.fixture
+def admin_token(make_users):
+    (_, token), = make_users(1, is_admin=True)
+    return token
+
+@pytest.mark.parametrize('body', [
+    [1],
+    'hello',
+    {'title': 'Hi', 'message': 'There', 'notification_type': 'urgent'},
+    {'title': 'Hi', 'message': 'There', 'audience': 'event', 'event_id': 'abc'},
+    {'title': 'Hi', 'message': 'There', 'audience': 'event', 'event_id': True},
+    {'title': 'Hi', 'message': 'There', 'audience': 'event', 'event_id': 10 ** 9},
+    {'title': 'Hi', 'message': 'There', 'audience': 'department', 'department': ['CSE']},
+])
+def test_invalid_broadcasts_are_rejected(client, admin_token, body):
+    response = client.post('/admin/notifications/broadcast', json=body, headers=auth(admin_token))
+    assert response.status_code == 400
+
+def test_event_broadcast_reaches_registrants(app, client, admin_token, make_users, make_event):
+    (student_id, token), = make_users(1)
+    event_id = make_event(student_id)
+    assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+
+    response = client.post('/admin/notifications/broadcast', headers=auth(admin_token), json={
+        'title': 'Room change', 'message': 'Moved to Hall 2', 'audience': 'event',
+        'event_id': event_id, 'notification_type': 'warning'
+    })
+    assert response.status_code == 200
+    assert response.get_json()['sent'] == 1
+    with app.app_context():
+        notification = main.Notification.query.filter_by(user_id=student_id, title='Room change').one()
+        assert notification.event_id == event_id
+        assert notification.notification_type == 'warning'
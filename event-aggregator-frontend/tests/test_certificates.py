@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import main
+from conftest import auth
+
+def attended_event(app, client, make_users, make_event, attendees):
+    (organizer_id, organizer_token), = make_users(1, is_organizer=True)
+    students = make_users(attendees)
+    event_id = make_event(organizer_id)
+    for _, token in students:
+        assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+    response = client.put(f'/admin/events/{event_id}/attendance', headers=auth(organizer_token), json={
+        'attendance': [{'user_id': user_id, 'attended': True} for user_id, _ in students]
+    })
+    assert response.status_code == 200
+    return event_id, organizer_token, [user_id for user_id, _ in students]
+
+def issued_notifications(app, event_id):
+    with app.app_context():
+        return main.Notification.query.filter_by(event_id=event_id, title='Certificate Issued').count()
+
+def test_issuing_twice_notifies_each_attendee_once(app, client, make_users, make_event):
+    event_id, token, students = attended_event(app, client, make_users, make_event, 5)
+
+    first = client.post(f'/admin/events/{event_id}/certificates', headers=auth(token))
+    second = client.post(f'/admin/events/{event_id}/certificates', headers=auth(token))
+    assert first.get_json()['issued'] == 5
+    assert second.get_json()['issued'] == 0
+    assert issued_notifications(app, event_id) == 5
+
+def test_concurrent_runs_issue_and_notify_once(app, client, make_users, make_event, monkeypatch):
+    event_id, token, students = attended_event(app, client, make_users, make_event, 40)
+    # Several insert-and-notify batches per run
+    monkeypatch.setitem(app.config, 'CERTIFICATE_BATCH_SIZE', 7)
+
+    def issue(_):
+        response = app.test_client().post(f'/admin/events/{event_id}/certificates', headers=auth(token))
+        assert response.status_code == 200
+        return response.get_json()['issued']
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        issued = list(pool.map(issue, range(4)))
+
+    assert sum(issued) == len(students)
+    assert issued_notifications(app, event_id) == len(students)
+    with app.app_context():
+        assert main.Certificate.query.filter_by(event_id=event_id).count() == len(students)
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+import main
+from conftest import auth
+from database_config import database_url, engine_options, sqlite_pragmas
+
+def pragma(connection, name):
+    return connection.exec_driver_sql(f'PRAGMA {name}').scalar()
+
+def test_sqlite_pragmas_are_applied_on_connect(app):
+    with app.app_context(), main.db.engine.connect() as connection:
+        assert pragma(connection, 'journal_mode') == 'wal'
+        assert pragma(connection, 'synchronous') == 1  # NORMAL
+        assert pragma(connection, 'busy_timeout') == app.config['SQLITE_BUSY_TIMEOUT']
+        assert pragma(connection, 'cache_size') == app.config['SQLITE_CACHE_SIZE']
+        assert pragma(connection, 'foreign_keys') == 1
+
+def test_foreign_keys_are_enforced(app, make_users):
+    (student_id, _), = make_users(1)
+    with app.app_context():
+        main.db.session.add(main.EventRegistration(user_id=student_id, event_id=10 ** 9))
+        with pytest.raises(IntegrityError):
+            main.db.session.commit()
+        main.db.session.rollback()
+
+def test_sqlite_pragmas_validate_and_skip_unset_values():
+    assert sqlite_pragmas(journal_mode='wal', synchronous=None, busy_timeout=100, mmap_size=None,
+                          cache_size=None, foreign_keys=False) == [('journal_mode', 'WAL'), ('busy_timeout', 100), ('foreign_keys', 'OFF')]
+    with pytest.raises(ValueError):
+        sqlite_pragmas(journal_mode='WAL; DROP TABLE user')
+    with pytest.raises(ValueError):
+        sqlite_pragmas(synchronous='SOMETIMES')
+
+def test_engine_options_by_backend():
+    pool = {'pool_size': 5, 'max_overflow': 10, 'pool_timeout': 30, 'pool_recycle': 1800}
+    assert engine_options('sqlite://', **pool) == {}
+    assert engine_options('sqlite:///events.db', **pool) == {'pool_size': 5, 'max_overflow': 10, 'pool_timeout': 30}
+    assert engine_options('postgresql://localhost/events', **pool) == dict(pool, pool_pre_ping=True)
+
+def test_database_url_from_the_environment():
+    assert database_url({}) == 'sqlite:///events.db'
+    assert database_url({'DATABASE_URL': 'postgres://u:p@db/events'}) == 'postgresql://u:p@db/events'
+    assert database_url({'DB_NAME': 'events', 'DB_USER': 'admin', 'DB_PASSWORD': 's3cret', 'DB_HOST': 'db'}) == \
+        'postgresql://admin:s3cret@db:5432/events'
+
+def test_deleting_an_event_keeps_its_notifications(app, client, make_users, make_event):
+    (organizer_id, organizer_token), (student_id, token) = make_users(2, is_organizer=True)
+    event_id = make_event(organizer_id)
+    assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+
+    assert client.delete(f'/events/{event_id}', headers=auth(organizer_token)).status_code == 200
+    with app.app_context():
+        titles = [n.title for n in main.Notification.query.filter_by(user_id=student_id)]
+        assert 'Event Registration Successful' in titles and 'Event Cancelled' in titles
+
+def test_events_with_certificates_are_not_deleted(app, client, make_users, make_event):
+    (organizer_id, organizer_token), (student_id, _) = make_users(2, is_organizer=True)
+    event_id = make_event(organizer_id)
+    with app.app_context():
+        main.db.session.add(main.EventRegistration(user_id=student_id, event_id=event_id, attended=True))
+        main.db.session.flush()
+        main.issue_event_certificates(main.db.session.get(main.Event, event_id))
+        main.db.session.commit()
+
+    assert client.delete(f'/events/{event_id}', headers=auth(organizer_token)).status_code == 400
+    with app.app_context():
+        assert main.db.session.get(main.Event, event_id) is not None
@@ -0,0 +1,26 @@
+import main
+
+def test_etag_depends_on_the_query_string(client):
+    etag = client.get('/events').headers['ETag']
+    response = client.get('/events?category=Technical', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+def test_write_in_another_process_is_not_served_from_the_cache(app, client, make_users, make_event):
+    (organizer_id, _), = make_users(1, is_organizer=True)
+    event_id = make_event(organizer_id, title='Quasar Night')
+    first = client.get('/events?search=Quasar')
+    assert [event['title'] for event in first.get_json()['events']] == ['Quasar Night']
+    assert client.get('/events?search=Quasar').headers['X-Cache'] == 'HIT'
+
+    # What another worker's edit leaves behind: new rows and a bumped
+    # version, but this process's response cache was never invalidated
+    with app.app_context():
+        main.Event.query.filter_by(id=event_id).update({'title': 'Quasar Night (moved)'})
+        main.bump_versions('events')
+        main.db.session.commit()
+
+    response = client.get('/events?search=Quasar', headers={'If-None-Match': first.headers['ETag']})
+    assert response.status_code == 200
+    assert response.headers['X-Cache'] == 'MISS'
+    assert [event['title'] for event in response.get_json()['events']] == ['Quasar Night (moved)']
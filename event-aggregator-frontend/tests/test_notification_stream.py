@@ -0,0 +1,57 @@
+import main
+from conftest import auth
+from notification_stream import NotificationBroker
+
+def drain(subscription):
+    messages = []
+    while True:
+        message = subscription.next_message(0)
+        if message is None:
+            return messages
+        messages.append(message)
+
+def test_ids_committed_out_of_order_are_still_delivered():
+    broker = NotificationBroker()
+    subscription = broker.subscribe(1)
+    broker.publish(1, 'notification', {'id': 10}, event_id=10)
+    broker.publish(1, 'notification', {'id': 7}, event_id=7)
+    broker.publish(1, 'notification', {'id': 10}, event_id=10)
+    assert [message.splitlines()[0] for message in drain(subscription)] == ['id: 10', 'id: 7']
+
+def test_broadcast_is_pushed_once_to_open_streams(app, client, make_users, make_event):
+    (admin_id, admin_token), = make_users(1, is_admin=True)
+    (student_id, token), (idle_id, _) = make_users(2)
+    event_id = make_event(admin_id)
+    assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+
+    subscription = main.notification_broker.subscribe(student_id)
+    idle = main.notification_broker.subscribe(idle_id)
+    try:
+        response = client.post('/admin/notifications/broadcast', headers=auth(admin_token), json={
+            'title': 'Bring your ID', 'message': 'Checked at the door', 'audience': 'event', 'event_id': event_id
+        })
+        assert response.status_code == 200
+        messages = drain(subscription)
+        assert sum('Bring your ID' in message for message in messages) == 1
+        assert any(message.startswith('event: unread_count') for message in messages)
+        assert not any('Bring your ID' in message for message in drain(idle))
+    finally:
+        main.notification_broker.unsubscribe(subscription)
+        main.notification_broker.unsubscribe(idle)
+
+def test_failed_push_does_not_fail_the_committed_write(app, client, make_users, make_event, monkeypatch):
+    (organizer_id, _), (student_id, token) = make_users(2)
+    event_id = make_event(organizer_id)
+
+    def unavailable(user_ids):
+        raise RuntimeError('database went away')
+    monkeypatch.setattr(main, 'get_unread_counts', unavailable)
+
+    subscription = main.notification_broker.subscribe(student_id)
+    try:
+        assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+        assert any('Event Registration Successful' in message for message in drain(subscription))
+    finally:
+        main.notification_broker.unsubscribe(subscription)
+    with app.app_context():
+        assert main.EventRegistration.query.filter_by(user_id=student_id, event_id=event_id).count() == 1
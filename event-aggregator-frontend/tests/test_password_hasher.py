@@ -0,0 +1,45 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import pytest
+
+import main
+import password_hasher
+from conftest import auth
+from password_hasher import HasherBusy, PasswordHasher
+
+@pytest.fixture
+def blocked_hasher(monkeypatch):
+    """(hasher, release): one worker thread whose hash jobs wait for release.set()"""
+    release = threading.Event()
+    monkeypatch.setattr(password_hasher, '_hash_password', lambda password, rounds: release.wait(10) and 'hashed')
+    hasher = PasswordHasher(workers=1, max_pending=1, timeout=0)
+    # A thread pool runs the patched job; the queue logic is the same
+    hasher._executor = ThreadPoolExecutor(max_workers=1)
+    yield hasher, release
+    release.set()
+    hasher.shutdown()
+
+def test_timed_out_job_keeps_its_queue_slot(blocked_hasher):
+    hasher, release = blocked_hasher
+    with pytest.raises(TimeoutError):
+        hasher.hash('secret')
+    # The job is still running in the pool, so the queue is still full
+    with pytest.raises(HasherBusy):
+        hasher.hash('secret')
+
+    release.set()
+    # Runs after the blocked job's done-callbacks on the only worker thread
+    hasher._executor.submit(lambda: None).result(timeout=10)
+    hasher.timeout = 10
+    assert hasher.hash('secret') == 'hashed'
+
+def test_hashing_timeout_answers_503(client, blocked_hasher, monkeypatch):
+    hasher, release = blocked_hasher
+    monkeypatch.setattr(main, 'password_hasher', hasher)
+    response = client.post('/register', json={
+        'username': 'slow_hash', 'email': 'slow_hash@college.edu', 'password': 'secret',
+        'department': 'Civil Engineering', 'year': '1st Year'
+    })
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
@@ -0,0 +1,52 @@
+import main
+from conftest import Clock, auth
+from principal_cache import Principal, PrincipalCache
+
+def test_claims_principal_expires_with_the_claims():
+    clock = Clock()
+    cache = PrincipalCache(ttl=300, claims_max_age=900, clock=clock, timer=clock)
+    admin = Principal(1, 'admin', is_admin=True)
+
+    # Claims with 0.1 s of trust left must not be cached for the full TTL
+    cache.set('token', admin, claims_issued_at=clock.now - 899.9)
+    assert cache.get(1, 'token') is admin
+    clock.now += 0.2
+    assert cache.get(1, 'token') is None
+
+def test_expired_claims_are_not_cached():
+    clock = Clock()
+    cache = PrincipalCache(ttl=300, claims_max_age=900, clock=clock, timer=clock)
+    cache.set('token', Principal(1, 'admin', is_admin=True), claims_issued_at=clock.now - 1000)
+    assert cache.get(1, 'token') is None
+
+def test_database_principal_gets_the_full_ttl():
+    clock = Clock()
+    cache = PrincipalCache(ttl=300, claims_max_age=900, clock=clock, timer=clock)
+    student = Principal(2, 'student')
+    cache.set('token', student)
+    clock.now += 299.9
+    assert cache.get(2, 'token') is student
+    clock.now += 0.2
+    assert cache.get(2, 'token') is None
+
+def test_persisted_text_uses_the_stored_username(app, client, make_users, make_event):
+    (organizer_id, _), (student_id, token) = make_users(2)
+    event_id = make_event(organizer_id)
+    assert client.get('/profile', headers=auth(token)).status_code == 200
+
+    # Renamed by another worker: this process still holds the old principal
+    with app.app_context():
+        main.User.query.filter_by(id=student_id).update({'username': f'renamed_{student_id}'})
+        main.db.session.commit()
+
+    assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+    with app.app_context():
+        main.EventRegistration.query.filter_by(user_id=student_id, event_id=event_id).update({'attended': True})
+        main.db.session.commit()
+    assert client.post(f'/events/{event_id}/certificates', headers=auth(token)).status_code == 202
+
+    with app.app_context():
+        notice = main.Notification.query.filter_by(user_id=organizer_id, event_id=event_id).one()
+        certificate = main.Certificate.query.filter_by(user_id=student_id, event_id=event_id).one()
+        assert notice.message.startswith(f'renamed_{student_id} has registered')
+        assert certificate.template_data['participant_name'] == f'renamed_{student_id}'
@@ -0,0 +1,71 @@
+import main
+from query_counter import QueryStats, track_queries
+from conftest import auth
+
+def test_event_listing_budget(client, make_users, make_event, query_budget):
+    (organizer_id, _), = make_users(1, is_organizer=True)
+    for _ in range(25):
+        make_event(organizer_id, category='Sports')
+    # A search term no other test uses, so the response cache misses
+    with query_budget(3):
+        response = client.get('/events?category=Sports&search=Test Event')
+    assert response.status_code == 200
+    assert len(response.get_json()['events']) >= 20
+
+def test_my_events_budget(client, make_users, make_event, query_budget):
+    (organizer_id, _), (student_id, token) = make_users(2, is_organizer=True)
+    event_ids = [make_event(organizer_id) for _ in range(12)]
+    for event_id in event_ids:
+        assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+    with query_budget(3):
+        response = client.get('/my-events', headers=auth(token))
+    assert response.status_code == 200
+    assert len(response.get_json()['registered_events']) == 12
+
+def test_certificates_budget(app, client, make_users, make_event, query_budget):
+    (organizer_id, _), (student_id, token) = make_users(2, is_organizer=True)
+    with app.app_context():
+        for event_id in [make_event(organizer_id) for _ in range(8)]:
+            event = main.db.session.get(main.Event, event_id)
+            main.db.session.add(main.EventRegistration(user_id=student_id, event_id=event_id, attended=True))
+            main.db.session.flush()
+            main.issue_event_certificates(event)
+        main.db.session.commit()
+    with query_budget(1):
+        response = client.get('/certificates', headers=auth(token))
+    assert response.status_code == 200
+    assert len(response.get_json()['certificates']) == 8
+
+def test_chunked_attendance_is_not_reported_as_n_plus_one(app, client, make_users, make_event, query_budget, monkeypatch):
+    (organizer_id, organizer_token), = make_users(1, is_organizer=True)
+    students = [user_id for user_id, _ in make_users(300)]
+    event_id = make_event(organizer_id)
+    with app.app_context():
+        main.db.session.add_all(main.EventRegistration(user_id=user_id, event_id=event_id) for user_id in students)
+        main.db.session.commit()
+    monkeypatch.setitem(app.config, 'ATTENDANCE_BATCH_SIZE', 20)
+    # 15 chunks of 3 statements each, plus the event lookup
+    with query_budget(46) as stats:
+        response = client.put(f'/admin/events/{event_id}/attendance', headers=auth(organizer_token), json={
+            'attendance': [{'user_id': user_id, 'attended': True} for user_id in students]
+        })
+    assert response.status_code == 200
+    assert response.get_json()['marked_attended'] == 300
+    assert stats.shapes().most_common(1)[0][1] == 15
+
+def test_per_row_statements_are_still_reported():
+    stats = QueryStats()
+    for _ in range(5):
+        stats.record('SELECT name FROM user WHERE user.id = ?', 0.001)
+        stats.record('SELECT name FROM user WHERE user.id IN (?, ?, ?)', 0.001)
+        stats.record('INSERT INTO notification (user_id) VALUES (?)', 0.001, executemany=True)
+    assert stats.repeated(5) == [(5, 'SELECT name FROM user WHERE user.id = ?')]
+
+def test_failed_statements_are_counted(client, make_users, make_event):
+    (student_id, token), = make_users(1)
+    event_id = make_event(student_id)
+    assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+    # The duplicate INSERT raises IntegrityError inside the database
+    with track_queries() as stats:
+        assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 400
+    assert any(statement.startswith('INSERT INTO event_registration') for statement in stats.statements)
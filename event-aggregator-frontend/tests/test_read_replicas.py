@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+from conftest import ROOT, Clock
+from read_replicas import ReplicaRouter
+
+def test_write_marker_keeps_reads_on_the_primary_in_any_router():
+    clock = Clock()
+    worker_a = ReplicaRouter(['replica'], 'secret', sticky_seconds=5, clock=clock)
+    worker_b = ReplicaRouter(['replica'], 'secret', sticky_seconds=5, clock=clock)
+    marker = worker_a.write_marker()
+
+    assert worker_b.choose(marker) is None
+    clock.now += 4.9
+    assert worker_b.choose(marker) is None
+    clock.now += 0.2
+    assert worker_b.choose(marker) == 'replica'
+    assert worker_b.choose() == 'replica'
+
+def test_forged_markers_are_ignored():
+    clock = Clock()
+    router = ReplicaRouter(['replica'], 'secret', clock=clock)
+    forged = ReplicaRouter(['replica'], 'other secret', clock=clock).write_marker()
+    assert router.choose(forged) == 'replica'
+    assert router.choose('9999999999.000.signature') == 'replica'
+    assert router.choose('garbage') == 'replica'
+
+def test_routing_with_two_sqlite_files(tmp_path):
+    # A process of its own: replicas are configured when main is imported
+    env = {key: value for key, value in os.environ.items() if key != 'DATABASE_URL'}
+    result = subprocess.run(
+        [sys.executable, os.path.join(ROOT, 'benchmarks', 'replica_routing.py')],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
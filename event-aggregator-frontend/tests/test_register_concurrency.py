@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import main
+from conftest import auth
+
+SEATS = 50
+
+@pytest.mark.parametrize('count, seats', [
+    (240, SEATS),
+    pytest.param(3000, 1000, marks=pytest.mark.slow, id='thousands'),
+])
+def test_concurrent_registrations_fill_exactly_the_seats(app, make_users, make_event, count, seats):
+    students = make_users(count)
+    event_id = make_event(students[0][0], max_participants=seats)
+
+    def register(token):
+        return app.test_client().post(f'/events/{event_id}/register', headers=auth(token)).status_code
+
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        statuses = list(pool.map(register, [token for _, token in students]))
+
+    # 400 = event full; anything else (500, locked database) is a failure
+    assert set(statuses) <= {200, 400}
+    assert statuses.count(200) == seats
+    assert statuses.count(400) == count - seats
+    with app.app_context():
+        event = main.db.session.get(main.Event, event_id)
+        registrations = main.EventRegistration.query.filter_by(event_id=event_id).count()
+        assert event.current_participants == registrations == event.max_participants == seats
+
+def test_registering_twice_takes_one_seat(app, client, make_users, make_event):
+    (student_id, token), = make_users(1)
+    event_id = make_event(student_id, max_participants=SEATS)
+
+    assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+    assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 400
+    with app.app_context():
+        assert main.db.session.get(main.Event, event_id).current_participants == 1
@@ -0,0 +1,40 @@
+from datetime import datetime
+
+import main
+from conftest import auth
+from query_counter import track_queries
+
+def set_stat(app, name, value):
+    with app.app_context():
+        main.StatsCounter.query.filter_by(name=name).update({'value': value})
+        main.db.session.commit()
+
+def test_stale_stats_are_recomputed_on_read(app, client, make_users):
+    (_, token), = make_users(1, is_admin=True)
+    assert client.get('/stats?fresh=true', headers=auth(token)).status_code == 200
+
+    # A fresh snapshot is served as stored...
+    set_stat(app, 'users', -1)
+    assert client.get('/stats', headers=auth(token)).get_json()['total_users'] == -1
+
+    # ...and one older than the refresh interval is rebuilt
+    stale = int(datetime.utcnow().timestamp()) - app.config['STATS_REFRESH_INTERVAL'] - 1
+    set_stat(app, 'refreshed_at', stale)
+    assert client.get('/stats', headers=auth(token)).get_json()['total_users'] > 0
+
+def test_registration_counters_are_written_behind(app, client, make_users, make_event):
+    (student_id, token), = make_users(1)
+    event_id = make_event(student_id)
+    main.deferred_counters.flush()
+    with app.app_context():
+        before = main.read_stats()['registrations'], main.get_versions('events')
+
+    with track_queries() as stats:
+        assert client.post(f'/events/{event_id}/register', headers=auth(token)).status_code == 200
+    assert not any('stats_counter' in statement for statement in stats.statements)
+
+    main.deferred_counters.flush()
+    with app.app_context():
+        registrations, (events_version,) = main.read_stats()['registrations'], main.get_versions('events')
+    assert registrations == before[0] + 1
+    assert events_version > before[1][0]
@@ -0,0 +1,45 @@
+"""
+Bounded per-key cache validated by version counters
+Each entry remembers the DataVersion counters it was computed under.
+A lookup passes the current counters (one primary-key read) and only
+gets the cached value back if they still match, so a write that bumps a
+counter invalidates the entry in every worker process without any
+cross-process signalling.
+"""
+
+import threading
+from collections import OrderedDict
+
+class VersionedCache:
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, versions):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != versions:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, versions, value):
+        with self._lock:
+            self._entries[key] = (versions, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses
+            }